@@ -1,27 +1,54 @@
 # trunk-ignore-all(flake8/F401)
 # trunk-ignore-all(flake8/E402)
 
-import importlib.metadata
 import logging
-
-import pint
+import threading
 
 # Set the default logging level for the package
 logging.basicConfig(level=logging.WARNING)
 logging.captureWarnings(True)
-pint.util.logger.setLevel(logging.ERROR)  # Mute Pint warnings
 
+__api_version__ = "0.6.0"
 
-# Single-sourcing the package version
-__version__ = importlib.metadata.version("cript")
-__short_version__ = __version__.rpartition(".")[0]
+_lazy_attribute_lock = threading.Lock()
 
-__api_version__ = "0.6.0"
 
-# Instantiate the Pint unit registry
-# https://pint.readthedocs.io/en/stable/tutorial.html#using-pint-in-your-projects
-# Note that this needs to be before the data model imports below
-pint_ureg = pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
+def __getattr__(name: str):
+    """
+    Create the attributes that are slow to compute on first access
+    so that they don't slow down `import cript`.
+    """
+    if name in ("__version__", "__short_version__"):
+        # Single-sourcing the package version
+        import importlib.metadata
+
+        version = importlib.metadata.version("cript")
+        globals().update(
+            __version__=version, __short_version__=version.rpartition(".")[0]
+        )
+        return globals()[name]
+
+    if name == "pint_ureg":
+        # Instantiate the Pint unit registry (only one, since units of
+        # different registries can't be combined)
+        # https://pint.readthedocs.io/en/stable/tutorial.html#using-pint-in-your-projects
+        with _lazy_attribute_lock:
+            if "pint_ureg" not in globals():
+                import pint
+
+                pint.util.logger.setLevel(logging.ERROR)  # Mute Pint warnings
+                globals()["pint_ureg"] = pint.UnitRegistry(
+                    autoconvert_offset_to_baseunit=True
+                )
+        return globals()["pint_ureg"]
+
+    if name == "AsyncAPI":
+        # Imported on first use since asyncio is slow to load
+        from cript.api.async_rest import AsyncAPI
+
+        return AsyncAPI
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 from cript.data_model import Collection  # noqa 402
@@ -51,6 +78,7 @@ from cript.data_model import (
     SoftwareConfiguration,
     User,
 )
+from cript.data_model.bulk import save_all
 from cript.data_model.paginator import Paginator
 
 DATA_MODEL_CLASSES = [
@@ -85,3 +113,5 @@ DATA_MODEL_NAMES: list[str] = [node.node_name.lower() for node in DATA_MODEL_CLA
 
 from cript.api.local import APILocal
 from cript.api.rest import API  # noqa 401 402
+from cript.api.retry import RetryPolicy
+from cript.cache import use_api_session
@@ -0,0 +1,129 @@
+import asyncio
+import contextvars
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from beartype import beartype
+
+from cript.api.base import APIBase
+from cript.api.exceptions import APISessionRequiredError
+from cript.cache import get_cached_api_session
+
+# Open asynchronous sessions by the ID of the API session they send requests with
+_async_sessions = weakref.WeakValueDictionary()
+
+
+class AsyncAPI:
+    """
+    The asyncio counterpart of `API`, with awaitable HTTP methods.
+
+    Requests are sent by a regular API session from a pool of worker threads,
+    so they share its connection, response cache and error handling
+    without blocking the event loop. Asynchronous node operations using the session
+    (e.g., `Material.aget` or `async for` over search results) share the same threads.
+
+    :param api: The API session used to send requests (e.g., an `API` or `APILocal`).
+                Defaults to the active or latest established session.
+    :param max_workers: The max number of concurrent requests, including node
+                        operations run with the session (e.g., `Material.aget`).
+                        Defaults to the session's `max_workers`.
+    """
+
+    def __init__(self, api: APIBase = None, max_workers: int = None):
+        if api is None:
+            api = get_cached_api_session()
+            if api is None:
+                raise APISessionRequiredError
+        self.api = api
+        self.url = api.url
+        self.host = api.host
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or api.max_workers,
+            thread_name_prefix="cript-async",
+        )
+        _async_sessions[id(api)] = self
+
+    @classmethod
+    async def connect(cls, *args, max_workers: int = None, **kwargs):
+        """
+        Establish an `API` session without blocking the event loop.
+
+        :param *args: Positional arguments of `API`.
+        :param max_workers: The max number of concurrent requests.
+        :param **kwargs: Keyword arguments of `API`.
+        :return: The asynchronous API session.
+        :rtype: cript.api.async_rest.AsyncAPI
+        """
+        from cript.api.rest import API
+
+        api = await asyncio.to_thread(API, *args, **kwargs)
+        return cls(api, max_workers=max_workers)
+
+    def __repr__(self):
+        return f"Connected to {self.url} (async)"
+
+    def __str__(self):
+        return f"Connected to {self.url} (async)"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Stop the worker threads once the pending requests are done.
+        """
+        if _async_sessions.get(id(self.api)) is self:
+            del _async_sessions[id(self.api)]
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, method, *args, **kwargs):
+        """Run a blocking method in a worker thread within the current context."""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, method, *args, **kwargs)
+        return await loop.run_in_executor(self._executor, call)
+
+    @beartype
+    async def get(self, url: str):
+        """Performs an HTTP GET request and handles errors."""
+        return await self._run(self.api.get, url)
+
+    @beartype
+    async def post(self, url: str, data: str = None, valid_codes: list = [201]):
+        """Performs an HTTP POST request and handles errors."""
+        return await self._run(self.api.post, url, data=data, valid_codes=valid_codes)
+
+    @beartype
+    async def put(self, url: str, data: str = None, valid_codes: list = [200]):
+        """Performs an HTTP PUT request and handles errors."""
+        return await self._run(self.api.put, url, data=data, valid_codes=valid_codes)
+
+    @beartype
+    async def patch(self, url: str, data: str = None, valid_codes: list = [200]):
+        """Performs an HTTP PATCH request and handles errors."""
+        return await self._run(self.api.patch, url, data=data, valid_codes=valid_codes)
+
+    @beartype
+    async def delete(self, url: str):
+        """Performs an HTTP DELETE request and handles errors."""
+        return await self._run(self.api.delete, url)
+
+
+async def run_in_session(api, method, *args, **kwargs):
+    """
+    Run a blocking method in a worker thread of the open `AsyncAPI`
+    of an API session so that it counts towards its max number of concurrent requests.
+    The default worker threads of asyncio are used if there is none.
+
+    :param api: The API session used by the method.
+    :param method: The blocking method.
+    :return: The result of the method.
+    """
+    async_api = _async_sessions.get(id(api))
+    if async_api is None or async_api.api is not api:
+        return await asyncio.to_thread(method, *args, **kwargs)
+    return await async_api._run(method, *args, **kwargs)
@@ -6,3 +6,6 @@ class APIBase:
 
     api_version = __api_version__
     latest_session = None
+
+    # Max number of concurrent requests used to fetch nested nodes
+    max_workers = 8
@@ -1,6 +1,5 @@
 import datetime
 import glob
-import json
 import os
 import pathlib
 import shutil
@@ -10,11 +9,11 @@ from typing import Union
 
 from beartype import beartype
 
-from cript import DATA_MODEL_NAMES
+from cript import DATA_MODEL_NAMES, codec
 from cript.api.base import APIBase
 from cript.api.exceptions import APIError
 from cript.api.utils import get_slug_from_url
-from cript.cache import api_session_cache
+from cript.cache import cache_api_session
 from cript.utils import is_valid_uid
 
 logger = getLogger(__name__)
@@ -136,8 +135,7 @@ class APILocal(APIBase):
         logger.info(f"Connection to {self.url} API was successful!")
 
         # Save session to cache
-        api_session_cache[self.host] = self
-        APIBase.latest_session = self
+        cache_api_session(self)
 
     def __repr__(self):
         return f"Connected to {self.url}"
@@ -173,12 +171,12 @@ class APILocal(APIBase):
             raise APIError("The specified node was not found.")
 
         with open(self.database_by_uid[uid], "r", encoding=ENCODING) as f:
-            return json.load(f)
+            return codec.loads(f.read())
 
     @beartype
     def post(self, url: str, data: str, *args, **kwargs):
         """Simulates an HTTP POST request to the local filesystem."""
-        data_dict = json.loads(data)
+        data_dict = codec.loads(data)
         slug = get_slug_from_url(url)
         uid = str(uuid.uuid4())
 
@@ -198,7 +196,7 @@ class APILocal(APIBase):
     @beartype
     def put(self, url: str, data: str, *args, **kwargs):
         """Simulates an HTTP PUT request to the local filesystem."""
-        data_dict = json.loads(data)
+        data_dict = codec.loads(data)
         uid = data_dict["uid"]
         slug = get_slug_from_url(url)
 
@@ -212,6 +210,24 @@ class APILocal(APIBase):
 
         return data_dict
 
+    @beartype
+    def patch(self, url: str, data: str, *args, **kwargs):
+        """Simulates an HTTP PATCH request to the local filesystem."""
+        data_dict = self.get(url)
+        data_dict.update(codec.loads(data))
+        uid = _get_uid_from_url(url)
+        slug = get_slug_from_url(url)
+
+        # Prep for save
+        data_dict["updated_at"] = datetime.datetime.now().isoformat()
+
+        # Save to local filesystem
+        file_name = self.folder / f"{slug}_{uid}.json"
+        with open(file_name, "w", encoding=ENCODING) as f:
+            f.write(codec.dumps(data_dict))
+
+        return data_dict
+
     @beartype
     def delete(self, url: str):
         """Simulates an HTTP DELETE request to the local filesystem."""
@@ -0,0 +1,372 @@
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Union
+
+
+class CachedResponse:
+    """
+    The body of an API response along with the validators
+    needed to revalidate it via a conditional GET.
+
+    :param content: The raw response body.
+    :param etag: Value of the `ETag` response header.
+    :param last_modified: Value of the `Last-Modified` response header.
+    :param expires_at: Timestamp until which the response can be used
+                       without revalidation.
+    """
+
+    def __init__(
+        self,
+        content: bytes,
+        etag: str = None,
+        last_modified: str = None,
+        expires_at: float = 0,
+    ):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        Create a cache entry from a `requests.Response`.
+
+        :param response: The response to be cached.
+        :return: The cache entry or `None` if the response must not be cached.
+        :rtype: cript.api.response_cache.CachedResponse
+        """
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return None
+        return cls(
+            response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def is_fresh(self):
+        """Indicates whether the response can be used without revalidation."""
+        return time.time() < self.expires_at
+
+    def can_revalidate(self):
+        """Indicates whether the response can be revalidated via a conditional GET."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self):
+        """
+        Get the headers used to revalidate this entry.
+
+        :return: The `If-None-Match` and/or `If-Modified-Since` headers.
+        :rtype: dict
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Size-bounded, in-memory LRU cache of API GET responses.
+    Entries older than `ttl` are revalidated with the server and a
+    `304 Not Modified` response is served from the cache.
+
+    :param max_size: The max number of responses to keep.
+    :param ttl: Seconds during which a response is used without revalidation.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 0):
+        if max_size < 1:
+            raise ValueError("The cache size must be a positive integer.")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, hit: bool):
+        """
+        Count a cache hit or miss.
+
+        :param hit: Indicates whether the response was served from the cache.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def __deepcopy__(self, memo):
+        # The cache is shared state and is never copied along with a node
+        return self
+
+    def get(self, key: str):
+        """
+        Get a cached response.
+
+        :param key: The cache key of the request.
+        :return: The cache entry or `None` if nothing usable is cached.
+        :rtype: cript.api.response_cache.CachedResponse
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse):
+        """
+        Store a response, evicting the least recently used entries if needed.
+
+        :param key: The cache key of the request.
+        :param entry: The response to be cached.
+        """
+        entry.expires_at = time.time() + self.ttl
+        if not self.ttl and not entry.can_revalidate():
+            self.invalidate(key)
+            return
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str):
+        """
+        Remove a cached response.
+
+        :param key: The cache key of the request.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class _Connection(sqlite3.Connection):
+    """An SQLite connection that can be tracked with weak references."""
+
+
+class DiskResponseCache:
+    """
+    Persistent cache of API GET responses stored in an SQLite file.
+    The file can be shared by concurrent threads and processes.
+    Entries older than `ttl` are revalidated with the server and the
+    oldest entries are evicted once the total size exceeds `max_size`.
+    Every response is revalidated by default, so the changes made by other
+    processes are seen at once. With a `ttl`, they may be missed for that long.
+
+    :param path: Path to the SQLite cache file.
+    :param ttl: Seconds during which a response is used without revalidation.
+    :param max_size: The max total size of cached responses in bytes.
+    """
+
+    # Number of writes between two eviction passes
+    evict_interval = 64
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        ttl: float = 0,
+        max_size: int = 512 * 1024**2,
+    ):
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        # The connections of all threads, which close once their thread is gone
+        self._connections = weakref.WeakSet()
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Responses are readable by the user only, like the session info cache
+        # (SQLite creates the WAL and shared memory files with the same mode)
+        os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    content BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL NOT NULL,
+                    stored_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at "
+                "ON responses (stored_at)"
+            )
+        self.evict()
+
+    def __deepcopy__(self, memo):
+        # The cache is shared state and is never copied along with a node
+        return self
+
+    def record(self, hit: bool):
+        """
+        Count a cache hit or miss.
+
+        :param hit: Indicates whether the response was served from the cache.
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _connect(self):
+        """
+        Get the SQLite connection of the current thread.
+
+        :return: The connection.
+        :rtype: sqlite3.Connection
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Only used by the current thread, but closed by `close()` from any thread
+            conn = sqlite3.connect(
+                self.path, timeout=30, factory=_Connection, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.add(conn)
+        return conn
+
+    def close(self):
+        """
+        Close the SQLite connections of all threads.
+        The cache can still be used afterwards, reopening connections as needed.
+        """
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def get(self, key: str):
+        """
+        Get a cached response.
+
+        :param key: The cache key of the request.
+        :return: The cache entry or `None` if nothing usable is cached.
+        :rtype: cript.api.response_cache.CachedResponse
+        """
+        row = (
+            self._connect()
+            .execute(
+                "SELECT content, etag, last_modified, expires_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+
+        entry = CachedResponse(row[0], etag=row[1], last_modified=row[2])
+        entry.expires_at = row[3]
+        if not entry.is_fresh() and not entry.can_revalidate():
+            return None
+        return entry
+
+    def set(self, key: str, entry: CachedResponse):
+        """
+        Store a response, evicting the oldest entries if needed.
+
+        :param key: The cache key of the request.
+        :param entry: The response to be cached.
+        """
+        now = time.time()
+        entry.expires_at = now + self.ttl
+        if not self.ttl and not entry.can_revalidate():
+            self.invalidate(key)
+            return
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.content,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.expires_at,
+                    now,
+                    len(entry.content),
+                ),
+            )
+
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.evict_interval == 0
+        if evict:
+            self.evict()
+
+    def invalidate(self, key: str):
+        """
+        Remove a cached response.
+
+        :param key: The cache key of the request.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def evict(self):
+        """
+        Remove expired responses that cannot be revalidated and the oldest
+        responses until the total size is below `max_size`.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM responses WHERE expires_at < ? "
+                "AND etag IS NULL AND last_modified IS NULL",
+                (time.time(),),
+            )
+            total_size = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            if total_size <= self.max_size:
+                return
+
+            rows = conn.execute("SELECT key, size FROM responses ORDER BY stored_at")
+            keys = []
+            for key, size in rows:
+                if total_size <= self.max_size:
+                    break
+                keys.append((key,))
+                total_size -= size
+            conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
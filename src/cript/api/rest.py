@@ -1,24 +1,62 @@
+import hashlib
 import json
+import os
+import tempfile
+import threading
+import time
 import warnings
-from distutils.version import StrictVersion
+from concurrent.futures import Future
 from getpass import getpass
 from logging import getLogger
+from typing import Union
 from urllib.parse import urlparse
 
 import requests
 from beartype import beartype
+from requests.adapters import HTTPAdapter
 
+from cript import codec
 from cript.api.base import APIBase
 from cript.api.exceptions import APIError
-from cript.api.utils import convert_to_api_url, get_api_url
+from cript.api.response_cache import CachedResponse, ResponseCache
+from cript.api.retry import RetryPolicy
+from cript.api.utils import (
+    convert_to_api_url,
+    get_api_url,
+    normalize_url,
+    parse_version,
+)
 from cript.cache import cache_api_session
 from cript.data_model.nodes.user import User
 from cript.data_model.utils import create_node
-from cript.storage_clients import AmazonS3Client, GlobusClient
 
 logger = getLogger(__name__)
 
 
+def _create_session(
+    pool_connections: int, pool_maxsize: int, keep_alive: bool, headers: dict = None
+):
+    """
+    Create an HTTP session whose connections are pooled and reused across requests.
+
+    :param pool_connections: The number of hosts to keep connection pools for.
+    :param pool_maxsize: The max number of connections kept open per host.
+    :param keep_alive: Indicates whether to keep connections open between requests.
+    :param headers: Headers sent with every request.
+    :return: The HTTP session.
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if headers is not None:
+        session.headers = headers
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+
 class API(APIBase):
     """
     The entry point for interacting with the CRIPT REST API.
@@ -26,9 +64,47 @@ class API(APIBase):
     :param host: The hostname of the relevant CRIPT instance. (e.g., criptapp.org)
     :param token: The API token used for authentication.
     :param tls: Indicates whether to use TLS encryption for the API connection.
+    :param cache_size: The max number of GET responses to keep in an in-memory
+                       cache that is revalidated via conditional GETs (0 disables it).
+    :param response_cache: A response cache to use instead of the in-memory one
+                           (e.g., a `DiskResponseCache` shared across processes).
+    :param max_workers: The max number of concurrent requests used to fetch nested nodes.
+    :param pool_connections: The number of hosts to keep connection pools for
+                             (e.g., the API and the file storage).
+    :param pool_maxsize: The max number of connections kept open per host.
+                         Defaults to `max_workers`, or 10 if that's lower.
+    :param keep_alive: Indicates whether to keep connections open between requests
+                       so they're reused rather than reconnected (and handshaked).
+    :param retry_policy: Decides which failed requests are retried and when
+                         (defaults to retrying idempotent requests with backoff).
+    :param timeout: Timeout of each request in seconds, either a single value
+                    or a `(connect, read)` tuple.
+    :param lazy: Indicates whether to defer the connection handshake until the session
+                 info (`user`, `storage_info`, `vocab` or `storage_client`) is needed.
+                 Invalid hosts and tokens are then only reported by the first request.
+    :param session_info_dir: A directory where the session info is cached
+                             so that new sessions can skip the handshake
+                             (a revoked token is then only reported by the first request).
+    :param session_info_ttl: Seconds during which the cached session info is used.
     """
 
-    def __init__(self, host: str = None, token: str = None, tls: bool = True):
+    def __init__(
+        self,
+        host: str = None,
+        token: str = None,
+        tls: bool = True,
+        cache_size: int = 0,
+        response_cache=None,
+        max_workers: int = 8,
+        pool_connections: int = 10,
+        pool_maxsize: int = None,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy = None,
+        timeout: Union[int, float, tuple, None] = (10, 120),
+        lazy: bool = False,
+        session_info_dir: Union[str, os.PathLike, None] = None,
+        session_info_ttl: float = 24 * 3600,
+    ):
         if host is None:
             host = input("Host: ")
         if token is None:
@@ -37,51 +113,191 @@ class API(APIBase):
         self.url = get_api_url(host, tls)
         self.search_url = f"{self.url}/search"
         self.host = urlparse(self.url).netloc
-        self.latest_api_version = None
-        self.user = None
-        self.storage_info = None
-        self.vocab = None
-
-        self.session = requests.Session()
-        self.session.headers = {
-            "Authorization": token,
-            "Content-Type": "application/json",
-            "Accept": f"application/json; version={self.api_version}",
-        }
+        self.max_workers = max_workers
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.timeout = timeout
+        if response_cache is None and cache_size:
+            response_cache = ResponseCache(cache_size)
+        self.response_cache = response_cache
+
+        # GET requests in flight by cache key, shared by concurrent callers
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # Number of cache invalidations, so that GETs overlapping a write aren't cached
+        self._invalidations = 0
+
+        # Responses depend on the API version and the user's permissions
+        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+        self._cache_namespace = f"{self.api_version}:{token_hash}"
+
+        if pool_maxsize is None:
+            pool_maxsize = max(max_workers, 10)
+        self.session = _create_session(
+            pool_connections,
+            pool_maxsize,
+            keep_alive,
+            headers={
+                "Authorization": token,
+                "Content-Type": "application/json",
+                "Accept": f"application/json; version={self.api_version}",
+            },
+        )
+        # Used by the storage clients to transfer files (without the API token)
+        self.storage_session = _create_session(
+            pool_connections, pool_maxsize, keep_alive
+        )
+
+        # Session info fetched by the connection handshake
+        self._session_info = None
+        self._connected = False
+        # Reentrant since the storage clients read the session info they're created with
+        self._session_info_lock = threading.RLock()
+        self._session_info_path = None
+        self._session_info_ttl = session_info_ttl
+        if session_info_dir is not None:
+            os.makedirs(session_info_dir, exist_ok=True)
+            key = hashlib.sha256(f"{self.url}:{self._cache_namespace}".encode())
+            self._session_info_path = os.path.join(
+                session_info_dir, f"session-info-{key.hexdigest()[:16]}.json"
+            )
 
         # Test API authentication by fetching session info
+        if not lazy:
+            self._connect()
+
+        # Add session to cache
+        cache_api_session(self)
+
+    @property
+    def latest_api_version(self):
+        return self._connect()["latest_api_version"]
+
+    @property
+    def user(self):
+        return self._connect()["user"]
+
+    @property
+    def storage_info(self):
+        return self._connect()["storage_info"]
+
+    @property
+    def vocab(self):
+        return self._connect()["vocab"]
+
+    @property
+    def storage_client(self):
+        return self._connect()["storage_client"]
+
+    def _connect(self):
+        """
+        Perform the connection handshake (once) by fetching the session info,
+        from the session info cache if possible.
+
+        :return: The session info.
+        :rtype: dict
+        """
+        if self._connected:
+            return self._session_info
+
+        with self._session_info_lock:
+            if self._session_info is not None:
+                return self._session_info
+
+            response_json = self._read_session_info()
+            if response_json is None:
+                response_json = self._fetch_session_info()
+                self._write_session_info(response_json)
+            else:
+                logger.debug(f"Using cached session info of {self.url}.")
+
+            session_info = {
+                "latest_api_version": response_json["latest_version"],
+                "user": create_node(User, response_json["user_info"]),
+                "storage_info": response_json["storage_info"],
+                "vocab": response_json.get("vocab"),
+                "storage_client": None,
+            }
+
+            # Define storage client
+            provider = session_info["storage_info"]["provider"]
+            self._session_info = session_info
+            try:
+                # Imported here since their dependencies are slow to load
+                if provider == "globus":
+                    from cript.storage_clients.globus import GlobusClient
+
+                    session_info["storage_client"] = GlobusClient(self)
+                elif provider == "s3":
+                    from cript.storage_clients.s3 import AmazonS3Client
+
+                    session_info["storage_client"] = AmazonS3Client(self)
+            except Exception:
+                self._session_info = None
+                raise
+            self._connected = True
+
+            # Warn user if an update is required
+            latest_api_version = session_info["latest_api_version"]
+            if parse_version(self.api_version) < parse_version(latest_api_version):
+                warnings.warn(response_json["version_warning"], stacklevel=3)
+
+            return session_info
+
+    def _fetch_session_info(self):
+        """
+        Fetch the session info, testing the API authentication.
+
+        :return: The session info JSON.
+        :rtype: dict
+        """
         try:
-            response = self.session.get(f"{self.url}/session-info/")
+            response = self._request("GET", f"{self.url}/session-info/")
         except Exception as e:
             raise APIError(
                 "Connection API failed, please review your host and token"
             ) from e
         if response.status_code == 200:
-            response_json = response.json()
-            self.latest_api_version = response_json["latest_version"]
-            self.user = create_node(User, response.json()["user_info"])
-            self.storage_info = response.json()["storage_info"]
-            self.vocab = response.json().get("vocab")
+            logger.info(f"Connection to {self.url} API was successful!")
+            return codec.loads(response.content)
         elif response.status_code == 404:
             raise APIError("Please provide a valid host.")
         else:
             raise APIError(str(response.content))
 
-        logger.info(f"Connection to {self.url} API was successful!")
+    def _read_session_info(self):
+        """
+        Read the session info from the session info cache if it hasn't expired.
 
-        # Define storage client
-        provider = self.storage_info["provider"]
-        if provider == "globus":
-            self.storage_client = GlobusClient(self)
-        elif provider == "s3":
-            self.storage_client = AmazonS3Client(self)
+        :return: The session info JSON or `None`.
+        :rtype: dict
+        """
+        path = self._session_info_path
+        if path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > self._session_info_ttl:
+                return None
+            with open(path, "rb") as f:
+                return codec.loads(f.read())
+        except (OSError, ValueError):
+            return None
 
-        # Warn user if an update is required
-        if StrictVersion(self.api_version) < StrictVersion(self.latest_api_version):
-            warnings.warn(response.json()["version_warning"], stacklevel=2)
+    def _write_session_info(self, response_json: dict):
+        """
+        Write the session info to the session info cache (readable by the user only).
 
-        # Add session to cache
-        cache_api_session(self)
+        :param response_json: The session info JSON.
+        """
+        path = self._session_info_path
+        if path is None:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(codec.dumps(response_json))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to cache the session info: {e}")
 
     def __repr__(self):
         return f"Connected to {self.url}"
@@ -89,49 +305,186 @@ class API(APIBase):
     def __str__(self):
         return f"Connected to {self.url}"
 
+    def _request(self, method: str, url: str, **kwargs):
+        """
+        Send an HTTP request, retrying it according to the retry policy.
+
+        :param method: The HTTP method.
+        :param url: The request URL.
+        :param **kwargs: Other arguments of `requests.Session.request`.
+        :return: The last response.
+        :rtype: requests.Response
+        """
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not policy.should_retry(method, attempt, error=e):
+                    raise
+                reason = e
+                delay = policy.get_backoff(attempt)
+            else:
+                if not policy.should_retry(method, attempt, response.status_code):
+                    return response
+                reason = response.status_code
+                delay = policy.get_backoff(attempt, response.headers.get("Retry-After"))
+
+            policy.record(reason)
+            attempt += 1
+            logger.warning(
+                f"{method} {url} failed ({reason}), "
+                f"retrying in {delay:.1f}s ({attempt}/{policy.total})."
+            )
+            time.sleep(delay)
+
+    def _cache_key(self, url: str):
+        """Generates the response cache key of a URL."""
+        return f"{self._cache_namespace}:{normalize_url(url)}"
+
+    def _invalidate_cache(self, url: str):
+        """Drops a cached GET response when the same URL is written to."""
+        key = self._cache_key(url)
+
+        # Later GETs shouldn't share a response that may predate the write
+        with self._inflight_lock:
+            self._invalidations += 1
+            self._inflight.pop(key, None)
+
+        if self.response_cache is not None:
+            self.response_cache.invalidate(key)
+
+    def _write(self, method: str, url: str, **kwargs):
+        """
+        Performs a write request, dropping the cached GET response of the URL
+        before it's sent and again once it's done since a GET sent meanwhile
+        may have stored the previous content.
+        """
+        self._invalidate_cache(url)
+        try:
+            return self._request(method, url, **kwargs)
+        finally:
+            self._invalidate_cache(url)
+
     @beartype
     def get(self, url: str):
-        """Performs an HTTP GET request and handles errors."""
+        """
+        Performs an HTTP GET request and handles errors.
+        Concurrent GETs of the same URL share a single request.
+        """
         url = convert_to_api_url(url)
-        response = self.session.get(url=url)
+        key = self._cache_key(url)
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if is_leader:
+            try:
+                future.set_result(self._get_content(url, key))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._inflight_lock:
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+
+        # Each caller gets its own copy of the JSON
+        return codec.loads(future.result())
+
+    def _get_content(self, url: str, key: str):
+        """
+        Performs an HTTP GET request, using the response cache if any.
+
+        :param url: The API URL.
+        :param key: The response cache key of the URL.
+        :return: The response content.
+        :rtype: bytes
+        """
+        cache = self.response_cache
+        cached = None
+        invalidations = self._invalidations
+        if cache is not None:
+            cached = cache.get(key)
+            if cached and cached.is_fresh():
+                cache.record(hit=True)
+                return cached.content
+
+        # Revalidate a stale cached response via a conditional GET
+        headers = cached.conditional_headers() if cached else None
+        response = self._request("GET", url, headers=headers)
+        # The response may predate a write sent meanwhile
+        overlapped = self._invalidations != invalidations
+        if response.status_code == 304 and cached:
+            cache.record(hit=True)
+            if not overlapped:
+                cache.set(key, cached)
+            return cached.content
         if response.status_code != 200:
             raise APIError("The specified node was not found.")
-        return json.loads(response.content)
+
+        if cache is not None:
+            cache.record(hit=False)
+            entry = CachedResponse.from_response(response)
+            if entry and not overlapped:
+                cache.set(key, entry)
+            else:
+                cache.invalidate(key)
+        return response.content
 
     @beartype
     def post(self, url: str, data: str = None, valid_codes: list = [201]):
         """Performs an HTTP POST request and handles errors."""
         url = convert_to_api_url(url)
-        response = self.session.post(url=url, data=data)
+        response = self._write("POST", url, data=data)
         if response.status_code not in valid_codes:
             try:
-                error = json.loads(response.content)
+                error = codec.loads(response.content)
             except json.decoder.JSONDecodeError:
                 error = f"Server error {response.status_code}"
             raise APIError(error)
-        return json.loads(response.content)
+        return codec.loads(response.content)
 
     @beartype
     def put(self, url: str, data: str = None, valid_codes: list = [200]):
         """Performs an HTTP PUT request and handles errors."""
         url = convert_to_api_url(url)
-        response = self.session.put(url=url, data=data)
+        response = self._write("PUT", url, data=data)
+        if response.status_code not in valid_codes:
+            try:
+                error = codec.loads(response.content)
+            except json.decoder.JSONDecodeError:
+                error = f"Server error {response.status_code}"
+            raise APIError(error)
+        return codec.loads(response.content)
+
+    @beartype
+    def patch(self, url: str, data: str = None, valid_codes: list = [200]):
+        """Performs an HTTP PATCH request and handles errors."""
+        url = convert_to_api_url(url)
+        response = self._write("PATCH", url, data=data)
         if response.status_code not in valid_codes:
             try:
-                error = json.loads(response.content)
+                error = codec.loads(response.content)
             except json.decoder.JSONDecodeError:
                 error = f"Server error {response.status_code}"
             raise APIError(error)
-        return json.loads(response.content)
+        return codec.loads(response.content)
 
     @beartype
     def delete(self, url: str):
         """Performs an HTTP DELETE request and handles errors."""
         url = convert_to_api_url(url)
-        response = self.session.delete(url)
+        response = self._write("DELETE", url)
         if response.status_code != 204:
             try:
-                error = json.loads(response.content)
+                error = codec.loads(response.content)
             except json.decoder.JSONDecodeError:
                 error = f"Server error {response.status_code}"
             raise APIError(error)
@@ -0,0 +1,134 @@
+import random
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Union
+
+from beartype import beartype
+
+
+class RetryPolicy:
+    """
+    Decides which failed API requests are retried and how long to wait before each retry.
+
+    Requests are retried on connection errors, timeouts and the given status codes.
+    The delay grows exponentially with random jitter
+    (i.e., up to `backoff_factor * 2 ** retry` seconds), unless the server
+    asks for a specific delay via a `Retry-After` header.
+
+    The number of retries is counted for monitoring.
+
+    :param total: The max number of retries of a request (0 disables retries).
+    :param backoff_factor: The base delay in seconds.
+    :param max_backoff: The max delay in seconds between two attempts.
+    :param status_codes: The response status codes that are retried.
+    :param methods: The HTTP methods that are retried.
+                    Only idempotent methods are retried by default.
+    :param respect_retry_after: Indicates whether to wait as long as the
+                                `Retry-After` header asks (up to `max_backoff`).
+    """
+
+    DEFAULT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    DEFAULT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    @beartype
+    def __init__(
+        self,
+        total: int = 5,
+        backoff_factor: Union[int, float] = 0.5,
+        max_backoff: Union[int, float] = 60,
+        status_codes=DEFAULT_STATUS_CODES,
+        methods=DEFAULT_METHODS,
+        respect_retry_after: bool = True,
+    ):
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+
+        # Retry counters (by status code or exception name)
+        self.retries = Counter()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"RetryPolicy(total={self.total}, backoff_factor={self.backoff_factor}, "
+            f"retries={dict(self.retries)})"
+        )
+
+    @property
+    def retry_count(self):
+        """The total number of retries made with this policy."""
+        return sum(self.retries.values())
+
+    def should_retry(
+        self, method: str, attempt: int, status_code: int = None, error=None
+    ):
+        """
+        Decide whether a failed request is retried.
+
+        :param method: The HTTP method of the request.
+        :param attempt: The number of retries already made for the request.
+        :param status_code: The response status code (if a response was received).
+        :param error: The exception raised by the request (if any).
+        :return: Whether to retry the request.
+        :rtype: bool
+        """
+        if attempt >= self.total or method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return True
+        return status_code in self.status_codes
+
+    def get_backoff(self, attempt: int, retry_after: str = None):
+        """
+        Get the delay before the next attempt of a request.
+
+        :param attempt: The number of retries already made for the request.
+        :param retry_after: The `Retry-After` header of the response, if any.
+        :return: The delay in seconds.
+        :rtype: float
+        """
+        if retry_after and self.respect_retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+
+        # Exponential backoff with "full jitter"
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * 2**attempt)
+        )
+
+    def record(self, reason):
+        """
+        Count a retry.
+
+        :param reason: The status code or exception that caused the retry.
+        """
+        if isinstance(reason, Exception):
+            reason = type(reason).__name__
+        with self._lock:
+            self.retries[reason] += 1
+
+
+def _parse_retry_after(value: str):
+    """
+    Parse a `Retry-After` header given in seconds or as an HTTP date.
+
+    :param value: The header value.
+    :return: The delay in seconds or `None` if the header is invalid.
+    :rtype: float
+    """
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
@@ -40,9 +40,38 @@ def convert_to_api_url(url: str):
     return f"{scheme}://{netloc}/api{path}"
 
 
+def normalize_url(url: str):
+    """
+    Normalize a node URL so equivalent URLs share a single cache key.
+    e.g., https://criptapp.org/material/<uid> --> https://criptapp.org/api/material/<uid>
+
+    :param url: The URL to be normalized.
+    :return: The normalized URL.
+    :rtype: str
+    """
+    return convert_to_api_url(url).rstrip("/")
+
+
 def get_slug_from_url(url: str):
     """Get the node slug from a URL."""
     path_list = urlparse(url).path.strip("/").split("/")
     if path_list[0] == "api":
         return path_list[1]
     return path_list[0]
+
+
+def parse_version(version: str):
+    """
+    Parse a version string (e.g., 0.6.0 or 1.0b2) into a comparable tuple.
+    Pre-releases sort before the corresponding release.
+
+    :param version: The version string.
+    :return: The comparable version.
+    :rtype: tuple
+    """
+    match = re.fullmatch(r"(\d+)\.(\d+)(?:\.(\d+))?(?:([ab])(\d+))?", version.strip())
+    if match is None:
+        raise ValueError(f"Invalid version number '{version}'.")
+    major, minor, patch, pre_type, pre_number = match.groups()
+    pre_release = (0, pre_type, int(pre_number)) if pre_type else (1, "", 0)
+    return (int(major), int(minor), int(patch or 0), *pre_release)
@@ -1,52 +1,191 @@
+import contextvars
+import threading
+from concurrent.futures import Future
 import weakref
+from contextlib import contextmanager
 from urllib.parse import urlparse
 
 from cript.api.base import APIBase
 from cript.api.exceptions import APISessionRequiredError
+from cript.api.utils import normalize_url
 
 # Stores all API sessions
 api_session_cache = weakref.WeakValueDictionary()
 
-# Stores all nodes
-node_cache = weakref.WeakSet()
+# The API session used by the current thread or asyncio task (see `use_api_session`)
+active_api_session = contextvars.ContextVar("active_api_session", default=None)
+
+# Stores all nodes with a URL or UID (i.e., an identity map)
+# Values are weak so the cache never keeps a node alive on its own
+node_cache = weakref.WeakValueDictionary()
+node_uid_cache = weakref.WeakValueDictionary()
+
+# Stores the URLs of nodes by their unique field values (i.e., an upsert index)
+unique_key_cache = {}
+
+# Nodes being created by normalized URL (see `get_or_create_node`)
+_pending_nodes = {}
+
+# Guards the caches so they can be shared by threads
+_lock = threading.Lock()
 
 
 def cache_api_session(api):
     """
     Adds an API session to the local cache.
     """
-    api_session_cache[api.host] = api
-    APIBase.latest_session = api
+    with _lock:
+        api_session_cache[api.host] = api
+        APIBase.latest_session = api
 
 
 def cache_node(node):
     """
-    Adds a node to the local cache.
+    Adds a node to the local cache using it's current URL and UID.
+    """
+    url = getattr(node, "url", None)
+    uid = getattr(node, "uid", None)
+    with _lock:
+        if url:
+            node_cache[normalize_url(url)] = node
+        if uid:
+            node_uid_cache[uid] = node
+
+
+def uncache_node(node, url: str = None, uid: str = None):
+    """
+    Removes a node's URL and/or UID entries from the local cache.
+    Entries that point to a different node are left untouched.
+    """
+    with _lock:
+        # The entry may vanish at any time if its node is garbage collected
+        if url:
+            key = normalize_url(url)
+            if node_cache.get(key) is node:
+                node_cache.pop(key, None)
+
+        if uid and node_uid_cache.get(uid) is node:
+            node_uid_cache.pop(uid, None)
+
+
+@contextmanager
+def use_api_session(api):
     """
-    node_cache.add(node)
+    Makes an API session the active session of the current context.
+    Nodes without a URL are saved, fetched and searched with it
+    instead of the latest established session.
+
+    The session only applies to the current thread or asyncio task
+    (and tasks created from it), so concurrent jobs can use different sessions.
+
+    :param api: The API session.
+    """
+    token = active_api_session.set(api)
+    try:
+        yield api
+    finally:
+        active_api_session.reset(token)
 
 
 def get_cached_api_session(url: str = None):
     """
     Gets an API object from the local cache using a URL
-    or returning the latest established session.
+    or returning the active session (see `use_api_session`)
+    or the latest established session.
     """
+    active_api = active_api_session.get()
     if url:
         host = urlparse(url).netloc
-        api = api_session_cache.get(host)
+        if active_api is not None and active_api.host == host:
+            return active_api
+        with _lock:
+            api = api_session_cache.get(host)
         if api is None:
             raise APISessionRequiredError
         return api
 
+    if active_api is not None:
+        return active_api
+
     # Default to latest session
     return APIBase.latest_session
 
 
-def get_cached_node(url: str):
+def cache_unique_key(key: tuple, url: str):
     """
-    Gets a node from the local cache using it's URL.
+    Adds the URL of the node with the given unique field values to the local cache.
     """
-    for instance in node_cache:
-        if hasattr(instance, "url") and url == instance.url:
-            return instance
+    with _lock:
+        unique_key_cache[key] = url
+
+
+def uncache_unique_key(key: tuple, url: str = None):
+    """
+    Removes the entry of the given unique field values from the local cache.
+    If a URL is given, an entry that points to a different URL is left untouched.
+    """
+    with _lock:
+        if url is None or unique_key_cache.get(key) == url:
+            unique_key_cache.pop(key, None)
+
+
+def get_cached_unique_url(key: tuple):
+    """
+    Gets the URL of the node with the given unique field values from the local cache.
+    """
+    with _lock:
+        return unique_key_cache.get(key)
+
+
+def get_cached_node(url: str = None, uid: str = None):
+    """
+    Gets a node from the local cache using it's URL or UID.
+    """
+    with _lock:
+        if url:
+            return node_cache.get(normalize_url(url))
+        if uid:
+            return node_uid_cache.get(uid)
     return None
+
+
+def get_or_create_node(url: str, create):
+    """
+    Gets a node from the local cache using it's URL or creates it if it's not there.
+    Threads creating the same node at the same time all get the same object.
+
+    :param url: The URL of the node.
+    :param create: Function that returns the new node. It's called without holding
+                   the cache lock, at most once at a time for a given URL.
+    :return: The node and whether it was created.
+    :rtype: tuple[cript.data_model.nodes.BaseNode, bool]
+    """
+    key = normalize_url(url)
+    while True:
+        future = Future()
+        with _lock:
+            node = node_cache.get(key)
+            if node is not None:
+                return node, False
+            pending = _pending_nodes.setdefault(key, future)
+        if pending is future:
+            break
+
+        # Wait for the thread creating the node (or try again if it failed)
+        try:
+            return pending.result(), False
+        except Exception:
+            continue
+
+    try:
+        # The new node caches itself once its URL is set
+        node = create()
+    except BaseException as error:
+        future.set_exception(error)
+        raise
+    else:
+        future.set_result(node)
+    finally:
+        with _lock:
+            _pending_nodes.pop(key, None)
+    return node, True
@@ -0,0 +1,154 @@
+import json
+from typing import Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Maps every digit to 0 so that number patterns can be found with plain
+# substring searches, which are much faster than regular expressions
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+
+# Float formats that differ between orjson and the standard library
+# e.g., 1e+16 vs 1e16 or 1e-05 vs 0.00001
+_FLOAT_MISMATCHES = (b"0e", b"0.0000")
+
+# orjson writes the DEL control character as is, the standard library escapes it
+_DEL = b"\x7f"
+
+# orjson decodes integers beyond 64 bits as floats
+_BIG_INTEGER = b"0" * 19
+
+# Unsupported types are passed to the standard library instead
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson
+    else 0
+)
+
+
+class JSONCodec:
+    """
+    Encodes and decodes JSON with the standard library.
+    API requests use compact JSON with non-ASCII characters escaped.
+    """
+
+    name = "json"
+
+    def dumps(self, obj, indent: int = None):
+        """
+        Serialize an object to JSON.
+
+        :param obj: The object to be serialized.
+        :param indent: Indentation level (compact JSON is used if `None`).
+        :return: The JSON string.
+        :rtype: str
+        """
+        if indent is None:
+            return json.dumps(obj, separators=(",", ":"))
+        return json.dumps(obj, indent=indent)
+
+    def loads(self, data: Union[str, bytes]):
+        """
+        Deserialize JSON.
+
+        :param data: The JSON string or bytes.
+        :return: The deserialized object.
+        """
+        return json.loads(data)
+
+
+class ORJSONCodec(JSONCodec):
+    """
+    Encodes and decodes JSON with `orjson`.
+
+    The results are identical to `JSONCodec`: anything `orjson` handles
+    differently (non-ASCII output, DEL characters, exponent float formats,
+    big integers, NaN literals, etc.) is passed to the standard library instead.
+    Non-finite floats are the exception since they are not valid JSON.
+    """
+
+    name = "orjson"
+
+    def dumps(self, obj, indent: int = None):
+        if indent is None:
+            try:
+                data = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+            except TypeError:
+                pass
+            else:
+                if data.isascii() and _DEL not in data:
+                    digits = data.translate(_DIGITS_TO_ZERO)
+                    if not any(pattern in digits for pattern in _FLOAT_MISMATCHES):
+                        return data.decode()
+        return super().dumps(obj, indent=indent)
+
+    def loads(self, data: Union[str, bytes]):
+        raw = data.encode() if isinstance(data, str) else data
+        if _BIG_INTEGER not in raw.translate(_DIGITS_TO_ZERO):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return super().loads(data)
+
+
+_codec = ORJSONCodec() if orjson else JSONCodec()
+
+
+def get_codec():
+    """
+    Get the JSON codec used by the API and the data model.
+
+    :return: The codec.
+    :rtype: cript.codec.JSONCodec
+    """
+    return _codec
+
+
+def set_codec(codec: Union[str, JSONCodec, None] = None):
+    """
+    Set the JSON codec used by the API and the data model.
+
+    :param codec: The codec or its name ("json" or "orjson").
+                  The fastest installed codec is used if `None`.
+    """
+    global _codec
+
+    if codec is None:
+        codec = "orjson" if orjson else "json"
+    if isinstance(codec, str):
+        if codec == "json":
+            codec = JSONCodec()
+        elif codec == "orjson":
+            if orjson is None:
+                raise ImportError("The 'orjson' package is not installed.")
+            codec = ORJSONCodec()
+        else:
+            raise ValueError(f"Unknown JSON codec: {codec}")
+    _codec = codec
+
+
+def dumps(obj, indent: int = None):
+    """
+    Serialize an object to JSON with the current codec.
+
+    :param obj: The object to be serialized.
+    :param indent: Indentation level (compact JSON is used if `None`).
+    :return: The JSON string.
+    :rtype: str
+    """
+    return _codec.dumps(obj, indent=indent)
+
+
+def loads(data: Union[str, bytes]):
+    """
+    Deserialize JSON with the current codec.
+
+    :param data: The JSON string or bytes.
+    :return: The deserialized object.
+    """
+    return _codec.loads(data)
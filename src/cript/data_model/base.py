@@ -1,11 +1,9 @@
 import abc
-import json
 from logging import getLogger
 
-from cript.api.exceptions import APIError
-from cript.cache import get_cached_api_session, get_cached_node
+from cript import codec
+from cript.data_model.hydration import generate_nested_nodes
 from cript.data_model.paginator import Paginator
-from cript.data_model.utils import get_data_model_class
 
 logger = getLogger(__name__)
 
@@ -21,13 +19,20 @@ class Base(abc.ABC):
     alt_names = list()
 
     def __repr__(self):
-        return self._to_json()
+        return self._to_json(indent=4)
 
     def __str__(self):
-        return self._to_json()
+        return self._to_json(indent=4)
 
-    def _to_json(self):
-        return json.dumps(self._prep_for_upload(), indent=4)
+    def _to_json(self, indent: int = None):
+        """
+        Serialize an object to JSON.
+
+        :param indent: Indentation level (compact JSON is used for API requests).
+        :return: The JSON string.
+        :rtype: str
+        """
+        return codec.dumps(self._prep_for_upload(), indent=indent)
 
     @abc.abstractmethod
     def _prep_for_upload(self):
@@ -44,6 +49,33 @@ class Base(abc.ABC):
             k.lstrip("_"): self.__getattribute__(k) for k in vars(self) if "__" not in k
         }
 
+    def _to_dict(self, fields: set = None):
+        """
+        Convert an object into a dict that can be sent to the API.
+        The object is walked once and nested objects are converted on the fly
+        so that none of the attributes are copied.
+
+        :param fields: Only convert these fields (all fields if `None`).
+        :return: The converted dict.
+        :rtype: dict
+        """
+        node_dict = self._clean_dict()
+        if fields is not None:
+            node_dict = {k: v for k, v in node_dict.items() if k in fields}
+        for key, value in node_dict.items():
+            if isinstance(value, Paginator):
+                node_dict[key] = value.url
+            elif hasattr(value, "_prep_for_upload"):
+                node_dict[key] = value._prep_for_upload()
+            elif isinstance(value, list):
+                node_dict[key] = [
+                    item._prep_for_upload()
+                    if hasattr(item, "_prep_for_upload")
+                    else item
+                    for item in value
+                ]
+        return node_dict
+
     @abc.abstractmethod
     def _add_node(self, node, attr_name):
         ...
@@ -52,90 +84,21 @@ class Base(abc.ABC):
     def _remove_node(self, node, attr):
         ...
 
-    def _generate_nested_nodes(self, get_level: int = 1, level: int = 0):
+    def _generate_nested_nodes(
+        self,
+        get_level: int = 1,
+        level: int = 0,
+        lazy: bool = False,
+        fetch: bool = True,
+    ):
         """
         Generate nested node objects within a given node.
 
         :param level: Current nested node level.
         :param get_level: Level to recursively get nested nodes.
+        :param lazy: Indicates whether to generate proxies instead of fetching nodes.
+        :param fetch: Indicates whether to fetch nested nodes that are not in memory.
         """
-        if level <= get_level:
-            level += 1
-
-        # Limit recursive node generation
-        skip_nodes = False
-        if level > get_level:
-            skip_nodes = True
-
-        node_dict = self.__dict__
-        fields_to_skip = {
-            "url",
-            "_Inventory__index_table",
-            "_Inventory__degenerate_index_table",
-        }
-        for key, value in node_dict.items():
-            # Skip empty values and other fields that should be skipped
-            if not value or key in fields_to_skip:
-                continue
-
-            # Generate nodes
-            api = get_cached_api_session()
-            if isinstance(value, str) and api.url in value and not skip_nodes:
-                # Check if node already exists in memory
-                local_node = get_cached_node(value)
-                if local_node:
-                    node_dict[key] = local_node
-                else:
-                    node_class = get_data_model_class(key)
-                    try:
-                        node_dict[key] = node_class.get(
-                            url=value, get_level=get_level, level=level
-                        )
-                    except APIError:
-                        # Leave the URL if node is not viewable
-                        pass
-
-            # Generate subobjects
-            elif isinstance(value, dict):
-                subobject_class = get_data_model_class(key)
-                subobject = subobject_class(**value)
-                node_dict[key] = subobject
-                subobject._generate_nested_nodes(get_level=get_level, level=level)
-
-            # Define Paginator attributes
-            elif isinstance(value, Paginator):
-                value.api = api
-                value.obj_class = get_data_model_class(key.lstrip("_"))
-                value.get_level = get_level
-
-            # Handle lists
-            elif isinstance(value, list):
-                for i in range(len(value)):
-                    # Generate nodes
-                    if (
-                        isinstance(value[i], str)
-                        and api.url in value[i]
-                        and not skip_nodes
-                    ):
-                        # Check if node already exists in memory
-                        local_node = get_cached_node(value[i])
-                        if local_node:
-                            value[i] = local_node
-                        else:
-                            node_class = get_data_model_class(key)
-                            try:
-                                value[i] = node_class.get(
-                                    url=value[i], get_level=get_level, level=level
-                                )
-                            except APIError:
-                                # Leave the URL if node is not viewable
-                                pass
-
-                    # Generate subobjects
-                    elif isinstance(value[i], dict):
-                        node_class = get_data_model_class(key)
-                        subobject = node_class(**value[i])
-                        value[i] = subobject
-                        subobject._generate_nested_nodes(
-                            get_level=get_level, level=level
-                        )
+        generate_nested_nodes(
+            [(self, level)], get_level=get_level, lazy=lazy, fetch=fetch
+        )
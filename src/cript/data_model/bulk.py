@@ -0,0 +1,135 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+
+from beartype import beartype
+
+from cript.data_model.exceptions import CircularDependencyError
+from cript.data_model.nodes.base_node import BaseNode
+from cript.data_model.subobjects.base_subobject import BaseSubobject
+
+logger = getLogger(__name__)
+
+
+@beartype
+def save_all(
+    nodes: list,
+    workers: int = 4,
+    get_level: int = 1,
+    update_existing: bool = False,
+    hydrate: bool = False,
+):
+    """
+    Save a graph of nodes, including the unsaved nodes they reference.
+
+    Nodes are saved in waves: a node is saved once every unsaved node it
+    references has been saved, and the nodes of each wave are saved concurrently.
+    The saving time is therefore proportional to the depth of the graph.
+
+    :param nodes: The nodes to be saved.
+    :param workers: The max number of nodes saved at the same time.
+    :param get_level: Level to recursively get nested nodes.
+    :param update_existing: Indicates whether to update existing nodes
+                            with the same unique fields.
+    :param hydrate: Indicates whether to fetch the nested nodes of saved nodes
+                    that are not in memory. Otherwise, saved nodes are only
+                    updated from the write responses.
+    :return: The waves of nodes in the order they were saved.
+    :rtype: list[list[cript.data_model.nodes.BaseNode]]
+    """
+    if workers < 1:
+        raise ValueError("The number of workers must be a positive integer.")
+
+    waves = plan_save(nodes)
+
+    # Save with the caller's active API session
+    context = contextvars.copy_context()
+
+    def save(node):
+        context.copy().run(
+            node.save,
+            get_level=get_level,
+            update_existing=update_existing,
+            hydrate=hydrate,
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for i, wave in enumerate(waves):
+            logger.info(f"Saving wave {i + 1} of {len(waves)} ({len(wave)} nodes).")
+            # Wait for the whole wave so that dependents are sent with URLs
+            list(executor.map(save, wave))
+
+    return waves
+
+
+def plan_save(nodes: list):
+    """
+    Sort nodes and the unsaved nodes they reference into waves
+    where each node only depends on nodes of previous waves.
+
+    :param nodes: The nodes to be saved.
+    :return: The waves of nodes.
+    :rtype: list[list[cript.data_model.nodes.BaseNode]]
+    """
+    # Discover the unsaved dependencies of each node
+    dependencies = {}
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if id(node) in dependencies:
+            continue
+        node_dependencies = {
+            id(dependency): dependency
+            for dependency in _find_unsaved_nodes(node)
+            if dependency is not node
+        }
+        dependencies[id(node)] = (node, node_dependencies)
+        pending.extend(node_dependencies.values())
+
+    # Topological sort in waves
+    dependents = {key: [] for key in dependencies}
+    remaining = {}
+    for key, (node, node_dependencies) in dependencies.items():
+        remaining[key] = len(node_dependencies)
+        for dependency_key in node_dependencies:
+            dependents[dependency_key].append(key)
+
+    waves = []
+    wave = [key for key, count in remaining.items() if count == 0]
+    while wave:
+        waves.append([dependencies[key][0] for key in wave])
+        next_wave = []
+        for key in wave:
+            del remaining[key]
+            for dependent_key in dependents[key]:
+                remaining[dependent_key] -= 1
+                if remaining[dependent_key] == 0:
+                    next_wave.append(dependent_key)
+        wave = next_wave
+
+    if remaining:
+        raise CircularDependencyError([dependencies[key][0] for key in remaining])
+
+    return waves
+
+
+def _find_unsaved_nodes(obj):
+    """
+    Find the unsaved nodes referenced by a node or subobject.
+
+    :param obj: The node or subobject.
+    :return: The unsaved nodes.
+    :rtype: list[cript.data_model.nodes.BaseNode]
+    """
+    unsaved = []
+    values = list(vars(obj).values())
+    while values:
+        value = values.pop()
+        if isinstance(value, BaseNode):
+            if value.url is None and value is not obj:
+                unsaved.append(value)
+        elif isinstance(value, BaseSubobject):
+            values.extend(vars(value).values())
+        elif isinstance(value, list):
+            values.extend(value)
+    return unsaved
@@ -4,41 +4,55 @@ import warnings
 from cript.exceptions import CRIPTError
 
 
+# Node URLs, with or without a scheme (e.g., criptapp.org/material/<uid>/)
+_URL_PATTERN = re.compile(r"(?:https?://)?[\w-]+(?:\.[\w-]+)+(?::\d+)?/[^\s\"'<>]*")
+
+
 class UniqueNodeError(CRIPTError):
     """
     Raised when a node is saved using a combination of field
     values that the database enforces as a unique set.
+
+    :param message: The error message returned by the API.
+    :param existing_url: URL of the existing node with the same unique fields.
+                         It's extracted from the message if not given.
     """
 
-    def __init__(self, message):
+    def __init__(self, message, existing_url: str = None):
         self.message = message
-        self.existing_url = None
-        url_find_pattern = (
-            r"[(https://)|\w]*?[\w]*\.[-/\w]*\.\w*[(/{1})]?[#-\./\w]*[(/{1,})]?"
-        )
-        all_urls = re.findall(url_find_pattern, message)
-        if len(all_urls) > 0:
-            if len(all_urls) > 1:
-                warnings.warn(
-                    "UniqueNodeError found more than one possible URL of a unique node."
-                    " Please report this bug here:"
-                    " https://github.com/C-Accel-CRIPT/cript/issues Thank you."
-                )
-            self.existing_url = all_urls[0]
-            while self.existing_url[-1] == ".":
-                self.existing_url = self.existing_url[:-1]
-
+        self.existing_url = existing_url
         if self.existing_url is None:
-            warnings.warn(
-                "UniqueNodeError failed to extract unique URL of existing node."
-                " Please report this bug here:"
-                " https://github.com/C-Accel-CRIPT/cript/issues Thank you."
-            )
+            self.existing_url = _find_existing_url(message)
 
     def __str__(self):
         return self.message
 
 
+def _find_existing_url(message: str):
+    """
+    Extract the URL of the existing unique node from an error message.
+
+    :param message: The error message.
+    :return: The URL or `None` if it couldn't be found.
+    :rtype: str
+    """
+    all_urls = _URL_PATTERN.findall(message)
+    if not all_urls:
+        warnings.warn(
+            "UniqueNodeError failed to extract unique URL of existing node."
+            " Please report this bug here:"
+            " https://github.com/C-Accel-CRIPT/cript/issues Thank you."
+        )
+        return None
+    if len(all_urls) > 1:
+        warnings.warn(
+            "UniqueNodeError found more than one possible URL of a unique node."
+            " Please report this bug here:"
+            " https://github.com/C-Accel-CRIPT/cript/issues Thank you."
+        )
+    return all_urls[0].rstrip(".")
+
+
 class UnsavedNodeError(CRIPTError):
     """Raised when an attempt is made to add an unsaved node to another node."""
 
@@ -96,3 +110,17 @@ class InvalidPage(CRIPTError):
 
     def __str__(self):
         return self.message
+
+
+class CircularDependencyError(CRIPTError):
+    """
+    Raised when unsaved nodes reference each other so that
+    none of them can be saved before the others.
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def __str__(self):
+        names = ", ".join(sorted({node.node_name for node in self.nodes}))
+        return f"Unsaved nodes reference each other and cannot be saved: {names}."
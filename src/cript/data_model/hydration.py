@@ -0,0 +1,213 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from logging import getLogger
+
+from cript.api.exceptions import APIError
+from cript.api.utils import normalize_url
+from cript.cache import get_cached_api_session, get_cached_node, get_or_create_node
+from cript.data_model.paginator import Paginator
+from cript.data_model.proxy import NodeProxy
+from cript.data_model.utils import create_node, get_data_model_class
+
+logger = getLogger(__name__)
+
+# Fields that never contain nested nodes
+FIELDS_TO_SKIP = {
+    "url",
+    "_url",
+    "_Inventory__index_table",
+    "_Inventory__degenerate_index_table",
+    "_BaseNode__dirty",
+    "_BaseNode__list_sizes",
+    "_BaseNode__unique_key",
+}
+
+
+class _Reference:
+    """A URL found in a container (node dict or list) that may be replaced by a node."""
+
+    def __init__(self, container, key, url: str, node_class, level: int):
+        self.container = container
+        self.key = key
+        self.url = url
+        self.node_class = node_class
+        self.level = level
+
+
+def generate_nested_nodes(
+    objs: list, get_level: int = 1, lazy: bool = False, fetch: bool = True
+):
+    """
+    Generate nested node objects within the given objects, one level at a time.
+
+    All unresolved references found at the current depth are deduplicated
+    against the node cache and fetched concurrently before descending.
+    In lazy mode, every unresolved reference is replaced by a `NodeProxy`
+    instead and nothing is fetched.
+
+    :param objs: List of `(obj, level)` tuples to be expanded.
+    :param get_level: Level to recursively get nested nodes.
+    :param lazy: Indicates whether to generate proxies instead of fetching nodes.
+    :param fetch: Indicates whether to fetch nested nodes that are not in memory.
+                  Otherwise, their URLs are left in place.
+    """
+    api = get_cached_api_session()
+    references = []
+    for obj, level in objs:
+        _expand(obj, api, references, get_level, level, lazy, fetch)
+
+    while references:
+        responses = _fetch_all(api, references)
+
+        new_objs = []
+        for reference in references:
+            # Check if node already exists in memory
+            node = get_cached_node(reference.url)
+            if node is None:
+                obj_json = responses.get(normalize_url(reference.url))
+                if obj_json is None:
+                    # Leave the URL if node is not viewable
+                    continue
+                node, created = get_or_create_node(
+                    obj_json["url"],
+                    partial(create_node, reference.node_class, obj_json),
+                )
+                if created:
+                    new_objs.append((node, reference.level))
+            reference.container[reference.key] = node
+
+        references = []
+        for obj, level in new_objs:
+            _expand(obj, api, references, get_level, level, lazy, fetch)
+
+
+def _expand(
+    obj, api, references: list, get_level: int, level: int, lazy: bool, fetch: bool
+):
+    """
+    Generate the subobjects of an object and collect the references
+    that need to be fetched.
+
+    :param obj: The node or subobject to be expanded.
+    :param api: The current API session.
+    :param references: List where the collected references are appended.
+    :param get_level: Level to recursively get nested nodes.
+    :param level: Current nested node level.
+    :param lazy: Indicates whether to generate proxies instead of fetching nodes.
+    :param fetch: Indicates whether to fetch nested nodes that are not in memory.
+    """
+    if level <= get_level:
+        level += 1
+
+    # Limit recursive node generation (proxies are generated at any level)
+    skip_nodes = level > get_level and not lazy
+
+    node_dict = obj.__dict__
+    for key, value in node_dict.items():
+        if key in FIELDS_TO_SKIP:
+            continue
+
+        # Replace items in a copy since the list may be shared with the raw JSON
+        if isinstance(value, list):
+            value = list(value)
+            node_dict[key] = value
+
+        # Skip empty values
+        if not value:
+            continue
+
+        # Collect nodes
+        if isinstance(value, str):
+            if not skip_nodes and api.url in value:
+                _add_reference(
+                    references, node_dict, key, value, key, level, lazy, fetch
+                )
+
+        # Generate subobjects
+        elif isinstance(value, dict):
+            subobject = get_data_model_class(key)(**value)
+            node_dict[key] = subobject
+            _expand(subobject, api, references, get_level, level, lazy, fetch)
+
+        # Define Paginator attributes
+        elif isinstance(value, Paginator):
+            value.api = api
+            value.obj_class = get_data_model_class(key.lstrip("_"))
+            value.get_level = get_level
+            value.lazy = lazy
+
+        # Handle lists
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                # Collect nodes
+                if isinstance(item, str):
+                    if not skip_nodes and api.url in item:
+                        _add_reference(
+                            references, value, i, item, key, level, lazy, fetch
+                        )
+
+                # Generate subobjects
+                elif isinstance(item, dict):
+                    subobject = get_data_model_class(key)(**item)
+                    value[i] = subobject
+                    _expand(subobject, api, references, get_level, level, lazy, fetch)
+
+
+def _add_reference(
+    references: list,
+    container,
+    key,
+    url: str,
+    attr: str,
+    level: int,
+    lazy: bool,
+    fetch: bool,
+):
+    """
+    Resolve a URL from the node cache, replace it by a proxy,
+    or queue it to be fetched.
+    """
+    # Check if node already exists in memory
+    local_node = get_cached_node(url)
+    if local_node:
+        container[key] = local_node
+        return
+
+    node_class = get_data_model_class(attr)
+    if node_class is None:
+        logger.debug(f"No node class found for '{attr}', leaving {url}.")
+        return
+
+    if lazy:
+        container[key] = NodeProxy(url, node_class)
+    elif fetch:
+        references.append(_Reference(container, key, url, node_class, level))
+
+
+def _fetch_all(api, references: list):
+    """
+    Fetch the JSON of all unique references concurrently.
+
+    :param api: The current API session.
+    :param references: The references to be fetched.
+    :return: Dictionary of normalized URLs to JSON (or `None` if not viewable).
+    :rtype: dict
+    """
+    urls = {}
+    for reference in references:
+        if get_cached_node(reference.url) is None:
+            urls.setdefault(normalize_url(reference.url), reference.url)
+
+    def fetch(url):
+        try:
+            return api.get(url)
+        except APIError:
+            return None
+
+    workers = min(api.max_workers, len(urls))
+    if workers <= 1:
+        return {key: fetch(url) for key, url in urls.items()}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(fetch, urls.values())
+        return dict(zip(urls.keys(), results))
@@ -1,12 +1,23 @@
 import abc
-import copy
-import json
+from functools import partial
 from logging import getLogger
 from typing import Union
 
 from beartype import beartype
 
-from cript.cache import cache_node, get_cached_api_session, get_cached_node
+from cript import codec
+from cript.api.exceptions import APIError
+from cript.api.utils import normalize_url
+from cript.cache import (
+    cache_node,
+    cache_unique_key,
+    get_cached_api_session,
+    get_cached_node,
+    get_cached_unique_url,
+    get_or_create_node,
+    uncache_node,
+    uncache_unique_key,
+)
 from cript.data_model.base import Base
 from cript.data_model.exceptions import (
     AddNodeError,
@@ -15,13 +26,29 @@ from cript.data_model.exceptions import (
     UnsavedNodeError,
 )
 from cript.data_model.paginator import Paginator
-from cript.data_model.utils import create_node, set_node_attributes
+from cript.data_model.utils import (
+    API_JSON_DEFAULT,
+    API_JSON_LIST,
+    API_JSON_RAW,
+    API_JSON_SETTER,
+    construct_node,
+    create_node,
+    get_api_json_fields,
+    set_node_attributes,
+)
 
 logger = getLogger(__name__)
 
+# Fields set by the database that are never sent in partial updates
+UNTRACKED_FIELDS = {"url", "uid", "created_at", "updated_at", "can_edit"}
+
 
 class BaseNode(Base, abc.ABC):
     slug = None
+    # Fields whose values the database enforces as a unique set
+    unique_fields = None
+    # Properties that `from_api_json` assigns without calling their setters
+    _api_json_raw_fields = ("url", "uid")
 
     def __init__(
         self,
@@ -40,22 +67,210 @@ class BaseNode(Base, abc.ABC):
         self.updated_at = updated_at
         self.can_edit = can_edit
 
-        # Add node to cache
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        # Track changed fields once the node has been loaded or saved
+        dirty = self.__dict__.get("_BaseNode__dirty")
+        if dirty is not None and "__" not in name:
+            field = name.lstrip("_")
+            if field not in UNTRACKED_FIELDS:
+                dirty.add(field)
+
+    @property
+    def url(self):
+        return self._url
+
+    @url.setter
+    def url(self, value):
+        # Keep the node cache in sync when the URL changes
+        # e.g., after a save, delete, or refresh
+        uncache_node(self, url=self.__dict__.get("_url"))
+        self._url = value
         cache_node(self)
 
+    @property
+    def uid(self):
+        return self._uid
+
+    @uid.setter
+    def uid(self, value):
+        uncache_node(self, uid=self.__dict__.get("_uid"))
+        self._uid = value
+        cache_node(self)
+
+    @property
+    def dirty_fields(self):
+        """
+        The fields changed since the node was last loaded or saved.
+        Changes are tracked for attribute assignments, `add_*`/`remove_*` methods,
+        changes of nested subobjects and list lengths.
+        Use `mark_dirty()` for other in-place changes.
+
+        :return: The changed fields or `None` if the node is not tracked (e.g., new nodes).
+        :rtype: set
+        """
+        from cript.data_model.subobjects.base_subobject import BaseSubobject
+
+        dirty = self.__dict__.get("_BaseNode__dirty")
+        if dirty is None:
+            return None
+
+        dirty = set(dirty)
+        list_sizes = self.__list_sizes
+        for key, value in self.__dict__.items():
+            if "__" in key:
+                continue
+            field = key.lstrip("_")
+            if field in dirty:
+                continue
+            if isinstance(value, list):
+                if len(value) != list_sizes.get(key):
+                    dirty.add(field)
+                elif any(
+                    isinstance(item, BaseSubobject) and item._is_modified()
+                    for item in value
+                ):
+                    dirty.add(field)
+            elif isinstance(value, BaseSubobject) and value._is_modified():
+                dirty.add(field)
+        return dirty
+
+    def mark_dirty(self, *fields: str):
+        """
+        Mark fields as changed so that they are sent on the next save.
+        e.g., after changing a list in place.
+
+        :param *fields: The names of the changed fields.
+        """
+        dirty = self.__dict__.get("_BaseNode__dirty")
+        if dirty is not None:
+            dirty.update(field.lstrip("_") for field in fields)
+
+    def _reset_dirty(self):
+        """
+        Mark every field as unchanged, e.g., after the node was loaded or saved.
+        """
+        from cript.data_model.subobjects.base_subobject import BaseSubobject
+
+        list_sizes = {}
+        for key, value in self.__dict__.items():
+            if isinstance(value, list):
+                list_sizes[key] = len(value)
+                for item in value:
+                    if isinstance(item, BaseSubobject):
+                        item._reset_modified()
+            elif isinstance(value, BaseSubobject):
+                value._reset_modified()
+        self.__list_sizes = list_sizes
+        self.__dirty = set()
+
+    def _update_from_response(
+        self, response: dict, get_level: int = 1, lazy: bool = False, fetch: bool = True
+    ):
+        """
+        Overwrite a node's attributes with an API response and generate nested nodes.
+
+        :param response: The JSON representation of the node.
+        :param get_level: Level to recursively get nested nodes.
+        :param lazy: Indicates whether to generate proxies instead of fetching nodes.
+        :param fetch: Indicates whether to fetch nested nodes that are not in memory.
+        """
+        # Keep the current nested nodes alive so that they are found in the
+        # node cache instead of being fetched again
+        previous_values = list(self.__dict__.values())
+        set_node_attributes(self, response)
+        self._generate_nested_nodes(get_level=get_level, lazy=lazy, fetch=fetch)
+        self._reset_dirty()
+        self._cache_unique_key()
+        del previous_values
+
+    def _unique_key(self):
+        """
+        Get the key of the node's unique field values in the upsert index.
+
+        :return: The key or `None` if the node has no (complete) unique fields.
+        :rtype: tuple
+        """
+        if not self.unique_fields:
+            return None
+
+        key = [self.slug]
+        for field in self.unique_fields:
+            value = getattr(self, field, None)
+            if isinstance(value, BaseNode):
+                value = value.url
+                if value:
+                    value = normalize_url(value)
+            elif isinstance(value, str) and value.startswith(("http://", "https://")):
+                value = normalize_url(value)
+            if not value:
+                return None
+            key.append(value)
+        return tuple(key)
+
+    def _cache_unique_key(self):
+        """
+        Index the node's URL by its unique field values so that
+        upserts of the same node can go straight to an update.
+        """
+        previous_key = self.__dict__.get("_BaseNode__unique_key")
+        if previous_key:
+            uncache_unique_key(previous_key, self.url)
+
+        key = self._unique_key()
+        if key and self.url:
+            cache_unique_key(key, self.url)
+        self.__unique_key = key
+
     @beartype
-    def save(self, get_level: int = 1, update_existing: bool = False):
+    def save(
+        self, get_level: int = 1, update_existing: bool = False, hydrate: bool = True
+    ):
         """
         Create or update a node in the database.
+        Only the fields changed since the node was loaded or saved are sent
+        for existing nodes and nothing is sent if none changed.
 
         :param node: The node to be saved.
         :param get_level: Level to recursively get nested nodes.
         :param update_existing: Indicates whether to update an
                                 existing node with the same unique fields.
+        :param hydrate: Indicates whether to fetch nested nodes that are not in memory.
+                        Otherwise, the saved node is only updated from the write response.
         """
         api = get_cached_api_session(self.url)
 
-        if self.url:
+        # Update a known node with the same unique fields without trying to create it
+        if self.url is None and update_existing:
+            key = self._unique_key()
+            unique_url = get_cached_unique_url(key) if key else None
+            if unique_url:
+                try:
+                    response = api.put(unique_url, data=self._to_json())
+                except APIError:
+                    # e.g., the node has been deleted since it was indexed
+                    # or it can't be edited, so let the server decide via POST
+                    uncache_unique_key(key, unique_url)
+                else:
+                    self.url = unique_url
+                    self._update_from_response(
+                        response, get_level=get_level, fetch=hydrate
+                    )
+                    logger.info(
+                        f"{self.node_name} node has been saved to the database."
+                    )
+                    return
+
+        dirty_fields = self.dirty_fields
+        if self.url and dirty_fields is not None:
+            if not dirty_fields:
+                logger.info(f"{self.node_name} node has no changes to be saved.")
+                return
+            # Update the changed fields of an existing object via PATCH
+            data = codec.dumps(self._to_dict(fields=dirty_fields))
+            response = api.patch(self.url, data=data, valid_codes=[200, 400])
+        elif self.url:
             # Update an existing object via PUT
             response = api.put(self.url, data=self._to_json(), valid_codes=[200, 400])
         else:
@@ -72,13 +287,12 @@ class BaseNode(Base, abc.ABC):
                 if unique_url and update_existing:
                     # Update existing unique node
                     self.url = unique_url
-                    self.save(get_level=get_level)
+                    self.save(get_level=get_level, hydrate=hydrate)
                     return
                 else:
-                    raise UniqueNodeError(response["errors"][0])
+                    raise UniqueNodeError(response["errors"][0], unique_url)
 
-        set_node_attributes(self, response)
-        self._generate_nested_nodes(get_level=get_level)
+        self._update_from_response(response, get_level=get_level, fetch=hydrate)
         logger.info(f"{self.node_name} node has been saved to the database.")
 
     @beartype
@@ -93,6 +307,9 @@ class BaseNode(Base, abc.ABC):
 
         api = get_cached_api_session(self.url)
         api.delete(self.url)
+        key = self._unique_key()
+        if key:
+            uncache_unique_key(key, self.url)
         self.url = None
         self.uid = None
         self.created_at = None
@@ -100,11 +317,13 @@ class BaseNode(Base, abc.ABC):
         logger.info("The node has been deleted from the database.")
 
     @beartype
-    def refresh(self, get_level: int = 1):
+    def refresh(self, get_level: int = 1, lazy: bool = False):
         """
         Overwrite a node's attributes with the latest values from the database.
 
         :param get_level: Level to recursively get nested nodes.
+        :param lazy: Indicates whether to generate nested nodes as proxies
+                     that are only fetched on first access.
         """
         if self.url is None:
             raise ValueError(
@@ -113,8 +332,7 @@ class BaseNode(Base, abc.ABC):
 
         api = get_cached_api_session(self.url)
         response = api.get(self.url)
-        set_node_attributes(self, response)
-        self._generate_nested_nodes(get_level=get_level)
+        self._update_from_response(response, get_level=get_level, lazy=lazy)
 
     @beartype
     def update(self, get_level: int = 1, **kwargs):
@@ -149,13 +367,56 @@ class BaseNode(Base, abc.ABC):
         node.save(get_level=get_level, update_existing=update_existing)
         return node
 
+    @classmethod
+    def from_api_json(cls, obj_json: dict):
+        """
+        Create a node from JSON returned by the API without validating it.
+        The server has already validated the data, so the JSON values are
+        assigned directly instead of calling the constructor (i.e., without
+        type checks or property setters with side effects like `File.source`).
+        Only setters that convert values (e.g., URLs to `Paginator` objects) are called.
+
+        JSON that doesn't match the constructor parameters (e.g., unknown or
+        missing keys) falls back to the constructor.
+        The JSON is left untouched so that it can be shared (e.g., a page of results).
+
+        :param obj_json: The JSON representation of the node.
+        :return: The created node.
+        :rtype: cript.data_model.nodes.BaseNode
+        """
+        fields, required = get_api_json_fields(cls)
+        if not (required.issubset(obj_json) and fields.keys() >= obj_json.keys()):
+            return construct_node(cls, obj_json)
+
+        node = cls.__new__(cls)
+        node_dict = node.__dict__
+        for key, (attr, how, default) in fields.items():
+            if how == API_JSON_RAW:
+                node_dict[attr] = obj_json.get(key, default)
+            elif how == API_JSON_LIST:
+                node_dict[attr] = obj_json.get(key) or []
+            elif how == API_JSON_SETTER:
+                setattr(node, attr, obj_json.get(key, default))
+            elif how == API_JSON_DEFAULT:
+                node_dict[attr] = default
+
+        cache_node(node)
+
+        # Track changes from here on
+        node._reset_dirty()
+        node._cache_unique_key()
+
+        return node
+
     @classmethod
     @beartype
-    def get(cls, get_level: int = 1, **kwargs):
+    def get(cls, get_level: int = 1, lazy: bool = False, **kwargs):
         """
         Get the JSON for a node and use it to generate a local node object.
 
         :param get_level: Level to recursively get nested nodes.
+        :param lazy: Indicates whether to generate nested nodes as proxies
+                     that are only fetched on first access.
         :param **kwargs: Query parameters.
         :return: The generated node object.
         :rtype: cript.data_model.nodes.BaseNode
@@ -165,6 +426,16 @@ class BaseNode(Base, abc.ABC):
         if len(kwargs) == 0:
             raise AttributeError("Query arguments must be provided.")
 
+        # Return the local node object if it's already in memory
+        if "url" in kwargs:
+            local_node = get_cached_node(url=kwargs["url"])
+        elif list(kwargs) == ["uid"]:
+            local_node = get_cached_node(uid=kwargs["uid"])
+        else:
+            local_node = None
+        if isinstance(local_node, cls):
+            return local_node
+
         api = get_cached_api_session()
 
         if "url" in kwargs:
@@ -181,14 +452,13 @@ class BaseNode(Base, abc.ABC):
 
         # Return the local node object if it already exists
         # Otherwise, create a new node
-        if "url" in obj_json:
-            local_node = get_cached_node(obj_json["url"])
-
-            if local_node:
-                return local_node
+        node, created = get_or_create_node(
+            obj_json["url"], partial(create_node, cls, obj_json)
+        )
+        if not created:
+            return node
 
-        node = create_node(cls, obj_json)
-        node._generate_nested_nodes(get_level=get_level, level=level)
+        node._generate_nested_nodes(get_level=get_level, level=level, lazy=lazy)
         return node
 
     @classmethod
@@ -198,6 +468,7 @@ class BaseNode(Base, abc.ABC):
         limit: Union[int, None] = None,
         offset: Union[int, None] = None,
         get_level: int = 1,
+        lazy: bool = False,
         **kwargs,
     ):
         """
@@ -206,6 +477,8 @@ class BaseNode(Base, abc.ABC):
         :param limit: The max number of items to return.
         :param offset: The starting position of the query.
         :param get_level: Level to recursively get nested nodes.
+        :param lazy: Indicates whether to generate nested nodes as proxies
+                     that are only fetched on first access.
         :param **kwargs: Query parameters.
         :return: A `Paginator` object.
         :rtype: cript.data_model.paginator.Paginator
@@ -215,30 +488,65 @@ class BaseNode(Base, abc.ABC):
 
         api = get_cached_api_session()
         url = f"{api.search_url}/{cls.slug}/"
-        payload = json.dumps(kwargs)
+        payload = codec.dumps(kwargs)
         return Paginator(
             url=url,
             node_name=cls.node_name,
             limit=limit,
             offset=offset,
             get_level=get_level,
+            lazy=lazy,
             payload=payload,
         )
 
-    def _to_json(self):
-        node_dict = copy.deepcopy(self._clean_dict())
+    @classmethod
+    async def aget(cls, **kwargs):
+        """
+        Asynchronous version of `get`, taking the same arguments.
+        The node is fetched in a worker thread so the event loop isn't blocked.
+
+        :return: The generated node object.
+        :rtype: cript.data_model.nodes.BaseNode
+        """
+        from cript.api.async_rest import run_in_session
+
+        api = get_cached_api_session(kwargs.get("url"))
+        return await run_in_session(api, cls.get, **kwargs)
+
+    @classmethod
+    async def asearch(cls, **kwargs):
+        """
+        Asynchronous version of `search`, taking the same arguments.
+        The first page is fetched in a worker thread so the event loop isn't blocked.
+        Iterate over the results with `async for`.
+
+        :return: A `Paginator` object.
+        :rtype: cript.data_model.paginator.Paginator
+        """
+        from cript.api.async_rest import run_in_session
+
+        paginator = cls.search(**kwargs)
+        await run_in_session(paginator.api, paginator.json)
+        return paginator
 
-        for key, value in node_dict.items():
-            if isinstance(value, Paginator):
-                node_dict[key] = value.url
-            elif hasattr(value, "_prep_for_upload"):
-                node_dict[key] = value._prep_for_upload()
-            elif isinstance(value, list):
-                for i in range(len(value)):
-                    if hasattr(value[i], "_prep_for_upload"):
-                        value[i] = value[i]._prep_for_upload()
+    async def asave(self, **kwargs):
+        """
+        Asynchronous version of `save`, taking the same arguments.
+        The node is saved in a worker thread so the event loop isn't blocked.
+        """
+        from cript.api.async_rest import run_in_session
 
-        return json.dumps(node_dict, indent=4)
+        await run_in_session(get_cached_api_session(self.url), self.save, **kwargs)
+
+    def _to_json(self, indent: int = None):
+        """
+        Serialize a node to JSON.
+
+        :param indent: Indentation level (compact JSON is used for API requests).
+        :return: The JSON string.
+        :rtype: str
+        """
+        return codec.dumps(self._to_dict(), indent=indent)
 
     def _prep_for_upload(self, first: bool = False):
         """
@@ -264,6 +572,7 @@ class BaseNode(Base, abc.ABC):
 
         if hasattr(self, attr_name):
             getattr(self, attr_name).append(node)
+            self.mark_dirty(attr_name)
         else:
             raise AddNodeError(node.node_name, self.node_name)
 
@@ -295,3 +604,4 @@ class BaseNode(Base, abc.ABC):
             raise RemoveNodeError(
                 f"{self.node_name} nodes do not contain {node.node_name} nodes."
             )
+        self.mark_dirty(attr)
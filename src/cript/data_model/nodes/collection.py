@@ -21,6 +21,7 @@ class Collection(BaseNode):
 
     node_name = "Collection"
     slug = "collection"
+    unique_fields = ("project", "name")
     alt_names = ["collections"]
 
     @beartype
@@ -22,6 +22,7 @@ class Computation(BaseNode):
 
     node_name = "Computation"
     slug = "computation"
+    unique_fields = ("experiment", "name")
     alt_names = ["computations"]
 
     @beartype
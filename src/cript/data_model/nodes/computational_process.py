@@ -25,6 +25,7 @@ class ComputationalProcess(BaseNode):
 
     node_name = "ComputationalProcess"
     slug = "computational-process"
+    unique_fields = ("experiment", "name")
     alt_names = ["computational_processes"]
 
     @beartype
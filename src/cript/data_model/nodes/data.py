@@ -20,6 +20,7 @@ class Data(BaseNode):
 
     node_name = "Data"
     slug = "data"
+    unique_fields = ("experiment", "name")
     alt_names = ["data"]
 
     @beartype
@@ -32,8 +33,8 @@ class Data(BaseNode):
         sample_preparation: Union[BaseNode, str, None] = None,
         computations: list[Union[BaseNode, str]] = None,
         computational_process: Union[BaseNode, str, None] = None,
-        materials=None,
-        processes=None,
+        materials: list[Union[BaseNode, str]] = None,
+        processes: list[Union[BaseNode, str]] = None,
         notes: Union[str, None] = None,
         citations: list[Union[Citation, dict]] = None,
         public: bool = False,
@@ -54,8 +55,15 @@ class Data(BaseNode):
         self.notes = notes
         self.group = auto_assign_group(group, experiment)
 
-    def save(self, get_level: int = 0, update_existing: bool = False):
-        BaseNode.save(self=self, get_level=get_level, update_existing=update_existing)
+    def save(
+        self, get_level: int = 0, update_existing: bool = False, hydrate: bool = True
+    ):
+        BaseNode.save(
+            self=self,
+            get_level=get_level,
+            update_existing=update_existing,
+            hydrate=hydrate,
+        )
 
     @beartype
     def add_file(self, file: Union[File, dict]):
@@ -19,6 +19,7 @@ class Experiment(BaseNode):
 
     node_name = "Experiment"
     slug = "experiment"
+    unique_fields = ("collection", "name")
     alt_names = ["experiments"]
 
     @beartype
@@ -87,5 +88,9 @@ class Experiment(BaseNode):
         if value:
             self._data = Paginator(url=value, node_name="Data")
 
-    def save(self, get_level: int = 0, update_existing: bool = False):
-        BaseNode.save(self, get_level=get_level, update_existing=update_existing)
+    def save(
+        self, get_level: int = 0, update_existing: bool = False, hydrate: bool = True
+    ):
+        BaseNode.save(
+            self, get_level=get_level, update_existing=update_existing, hydrate=hydrate
+        )
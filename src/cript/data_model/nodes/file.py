@@ -9,8 +9,7 @@ from cript.data_model.exceptions import FileSizeLimitError, UniqueNodeError
 from cript.data_model.nodes.base_node import BaseNode
 from cript.data_model.nodes.group import Group
 from cript.data_model.nodes.project import Project
-from cript.data_model.utils import auto_assign_group, set_node_attributes
-from cript.storage_clients import AmazonS3Client, GlobusClient
+from cript.data_model.utils import auto_assign_group
 from cript.utils import convert_file_size, sha256_hash
 
 logger = getLogger(__name__)
@@ -22,6 +21,8 @@ class File(BaseNode):
     node_name = "File"
     slug = "file"
     alt_names = ["files"]
+    # The setter hashes local files, which doesn't apply to server JSON
+    _api_json_raw_fields = BaseNode._api_json_raw_fields + ("source",)
 
     @beartype
     def __init__(
@@ -74,7 +75,20 @@ class File(BaseNode):
         self._source = value
 
     @beartype
-    def save(self, get_level: int = 1, update_existing: bool = False):
+    def save(
+        self, get_level: int = 1, update_existing: bool = False, hydrate: bool = True
+    ):
+        """
+        Create or update a node in the database and upload the file if needed.
+        The node is refreshed after an upload to get the fields set by the upload.
+
+        :param get_level: Level to recursively get nested nodes.
+        :param update_existing: Indicates whether to update an existing node with
+                                the same unique fields.
+        :param hydrate: Indicates whether to fetch nested nodes that are not in memory
+                        and to refresh the node after an upload.
+                        Otherwise, the saved node is only updated from the write response.
+        """
         api = get_cached_api_session(self.url)
 
         if api.host == "localhost":
@@ -96,23 +110,27 @@ class File(BaseNode):
                 if unique_url and update_existing:
                     # Update existing unique node
                     self.url = unique_url
-                    self.save(get_level=get_level)
+                    self.save(get_level=get_level, hydrate=hydrate)
                     return
                 else:
-                    raise UniqueNodeError(response["errors"][0])
+                    raise UniqueNodeError(response["errors"][0], unique_url)
 
+        uploaded = True
         if api.host == "localhost":
             api.move_copy_file(self.source, api.data_folder)
         elif os.path.exists(self.source):
             url = response["url"]
             uid = response["uid"]
             self._upload_file(api, url, uid)
+        else:
+            uploaded = False
 
-        set_node_attributes(self, response)
-        self._generate_nested_nodes(get_level=get_level)
+        self._update_from_response(response, get_level=get_level, fetch=hydrate)
         logger.info(f"{self.node_name} node has been saved to the database.")
 
-        self.refresh(get_level=get_level)
+        # The write response is up to date unless a file was uploaded
+        if uploaded and hydrate:
+            self.refresh(get_level=get_level)
 
     def _upload_file(self, api, url, uid):
         """
@@ -124,9 +142,10 @@ class File(BaseNode):
         if file_size > max_file_size:
             raise FileSizeLimitError(convert_file_size(max_file_size))
 
-        if isinstance(api.storage_client, GlobusClient):
+        provider = api.storage_info["provider"]
+        if provider == "globus":
             api.storage_client.https_upload(url, uid, self)
-        elif isinstance(api.storage_client, AmazonS3Client):
+        elif provider == "s3":
             if file_size < 6291456:
                 api.storage_client.single_file_upload(uid, self)
             else:
@@ -146,7 +165,8 @@ class File(BaseNode):
         if path is None:
             path = f"./{self.name}"
 
-        if isinstance(api.storage_client, GlobusClient):
+        provider = api.storage_info["provider"]
+        if provider == "globus":
             api.storage_client.https_download(self, path)
-        elif isinstance(api.storage_client, AmazonS3Client):
+        elif provider == "s3":
             pass  # Coming soon
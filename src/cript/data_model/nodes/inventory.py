@@ -17,6 +17,7 @@ class Inventory(BaseNode):
 
     node_name = "Inventory"
     slug = "inventory"
+    unique_fields = ("collection", "name")
 
     @beartype
     def __init__(
@@ -39,6 +40,13 @@ class Inventory(BaseNode):
         self.__index_table = dict()
         self.__degenerate_index_table = set()
 
+    @classmethod
+    def from_api_json(cls, obj_json: dict):
+        node = super().from_api_json(obj_json)
+        node.__index_table = dict()
+        node.__degenerate_index_table = set()
+        return node
+
     def __getitem__(self, obj: Union[int, slice, str]) -> Material:
         """
         obj can be an index or slice of self.materials or a unique identifier of a material
@@ -19,6 +19,7 @@ class Material(BaseNode):
 
     node_name = "Material"
     slug = "material"
+    unique_fields = ("project", "name")
     alt_names = ["materials", "components", "products", "waste"]
 
     @beartype
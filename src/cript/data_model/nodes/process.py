@@ -25,6 +25,7 @@ class Process(BaseNode):
 
     node_name = "Process"
     slug = "process"
+    unique_fields = ("experiment", "name")
     alt_names = ["processes", "prerequisite_processes", "sample_preparation"]
 
     @beartype
@@ -18,6 +18,7 @@ class Project(BaseNode):
 
     node_name = "Project"
     slug = "project"
+    unique_fields = ("group", "name")
 
     @beartype
     def __init__(
@@ -7,7 +7,6 @@ from cript.cache import get_cached_api_session
 from cript.data_model.exceptions import UniqueNodeError
 from cript.data_model.nodes.base_node import BaseNode
 from cript.data_model.nodes.group import Group
-from cript.data_model.utils import set_node_attributes
 
 logger = getLogger(__name__)
 
@@ -57,7 +56,9 @@ class Reference(BaseNode):
         self.group = group
 
     @beartype
-    def save(self, get_level: int = 1, update_existing: bool = False):
+    def save(
+        self, get_level: int = 1, update_existing: bool = False, hydrate: bool = True
+    ):
         """
         Create or update a node in the database.
 
@@ -65,6 +66,8 @@ class Reference(BaseNode):
         :param get_level: Level to recursively get nested nodes.
         :param update_existing: Indicates whether to update an existing node with
                                 the same unique fields.
+        :param hydrate: Indicates whether to fetch nested nodes that are not in memory.
+                        Otherwise, the saved node is only updated from the write response.
         """
         api = get_cached_api_session(self.url)
 
@@ -81,11 +84,10 @@ class Reference(BaseNode):
             if unique_url and update_existing:
                 # Update existing unique node
                 self.url = unique_url
-                self.save(get_level=get_level)
+                self.save(get_level=get_level, hydrate=hydrate)
                 return
             else:
-                raise UniqueNodeError(response["errors"][0])
+                raise UniqueNodeError(response["errors"][0], unique_url)
 
-        set_node_attributes(self, response)
-        self._generate_nested_nodes(get_level=get_level)
+        self._update_from_response(response, get_level=get_level, fetch=hydrate)
         logger.info(f"{self.node_name} node has been saved to the database.")
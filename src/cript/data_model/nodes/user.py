@@ -1,4 +1,5 @@
 from logging import getLogger
+from typing import Union
 
 from beartype import beartype
 
@@ -25,7 +26,7 @@ class User(BaseNode):
         username: str = None,
         email: str = None,
         orcid_id: str = None,
-        groups=None,
+        groups: list[Union[BaseNode, str]] = None,
         public: bool = False,
         **kwargs
     ):
@@ -1,15 +1,114 @@
-import copy
+import contextlib
+import queue
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Union
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from beartype import beartype
 
 from cript.api.exceptions import APIError
-from cript.cache import get_cached_api_session, get_cached_node
+from cript.cache import get_cached_api_session, get_or_create_node
 from cript.data_model.exceptions import InvalidPage
 from cript.data_model.utils import create_node, get_data_model_class
 
 
+def _set_query_params(url: str, **params):
+    """
+    Set query parameters of a URL, ignoring parameters with empty values.
+
+    :param url: The original URL.
+    :param **params: The query parameters to be set.
+    :return: The updated URL.
+    :rtype: str
+    """
+    parsed_url = urlparse(url)
+    parsed_qs = parse_qs(parsed_url.query)
+    for key, value in params.items():
+        if value:
+            parsed_qs[key] = value
+    query = urlencode(parsed_qs, doseq=True)
+    new_parts = list(parsed_url)
+    new_parts[4] = query
+    return urlunparse(new_parts)
+
+
+def _get_offset(url: str):
+    """Get the `offset` query parameter of a URL."""
+    return int(parse_qs(urlparse(url).query).get("offset", [0])[0])
+
+
+class _PagePrefetcher:
+    """
+    Fetches the following pages in a background thread, staying
+    at most `depth` pages ahead of the consumer.
+
+    :param get_page: Bound method used to get the raw JSON of a page.
+    :param url: URL of the first page to be fetched.
+    :param depth: The max number of pages fetched ahead.
+    """
+
+    def __init__(self, get_page, url: str, depth: int):
+        self.next_url = url
+        # Weak so that an abandoned paginator can still be garbage collected
+        self._get_page = weakref.WeakMethod(get_page)
+        self._pages = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(url,), daemon=True)
+        self._thread.start()
+
+    def _run(self, url: str):
+        while url and not self._stop.is_set():
+            get_page = self._get_page()
+            if get_page is None:
+                return
+            try:
+                page = get_page(url)
+            except Exception as e:
+                self._put(e)
+                return
+            del get_page
+            self._put(page)
+            url = page["next"]
+        self._put(None)
+
+    def _put(self, item):
+        # Give up if the consumer stopped while the queue is full
+        while not self._stop.is_set() and self._get_page() is not None:
+            try:
+                self._pages.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def get(self):
+        """
+        Get the next page, waiting for it to be fetched if needed.
+
+        :return: The page JSON or `None` after the last page.
+        :rtype: dict
+        """
+        page = self._pages.get()
+        if isinstance(page, Exception):
+            self.close()
+            raise page
+        self.next_url = page["next"] if page else None
+        return page
+
+    def close(self, wait: bool = True):
+        """
+        Stop fetching pages.
+
+        :param wait: Indicates whether to wait for the thread to end
+                     (i.e., for the page being fetched, if any).
+        """
+        self._stop.set()
+        if wait and threading.current_thread() is not self._thread:
+            self._thread.join()
+
+
 class Paginator:
     """
     Paginator for object lists and raw JSON.
@@ -20,8 +119,15 @@ class Paginator:
     :param limit: The max number of items per page.
     :param offset: The starting position of the paginator.
     :param get_level: Level to recursively get nested nodes.
+    :param lazy: Indicates whether nested nodes are generated as proxies
+                 that are only fetched on first access.
+    :param prefetch: The number of following pages fetched in a background
+                     thread while the current page is consumed (0 disables it).
     """
 
+    # Also set if `__init__` fails (e.g., on invalid arguments), for `__del__`
+    _prefetcher = None
+
     @beartype
     def __init__(
         self,
@@ -31,16 +137,40 @@ class Paginator:
         limit: Union[int, None] = None,
         offset: Union[int, None] = None,
         get_level: int = 1,
+        lazy: bool = False,
+        prefetch: int = 0,
     ):
         self.url = url
-        self.api = get_cached_api_session(url)
+        self._api = None
         self.node_class = get_data_model_class(node_name)
         self.limit = limit
         self.offset = offset
         self.get_level = get_level
+        self.lazy = lazy
+        self.prefetch = prefetch
         self.payload = payload
         self._raw = None
         self._count = None
+        self._prefetcher = None
+
+    def __del__(self):
+        # Garbage collection shouldn't wait for a page being fetched
+        self._close_prefetcher(wait=False)
+
+    @property
+    def api(self):
+        """
+        The API session of the paginator's URL.
+        It's looked up on first use since paginators are created for every
+        node with paginated fields, most of which are never iterated.
+        """
+        if self._api is None:
+            self._api = get_cached_api_session(self.url)
+        return self._api
+
+    @api.setter
+    def api(self, value):
+        self._api = value
 
     def json(self):
         """
@@ -54,28 +184,105 @@ class Paginator:
             return self._raw["results"]
 
         # Construct URL
-        parsed_url = urlparse(self.url)
-        parsed_qs = parse_qs(parsed_url.query)
-        if self.limit:
-            parsed_qs["limit"] = self.limit
-        if self.offset:
-            parsed_qs["offset"] = self.offset
-        query = urlencode(parsed_qs, doseq=True)
-        new_parts = list(parsed_url)
-        new_parts[4] = query
-        self.url = urlunparse(new_parts)
-
-        # Get JSON response
+        self.url = _set_query_params(self.url, limit=self.limit, offset=self.offset)
+
+        self._raw = self._get_page(self.url)
+
+        # Start fetching the following pages in the background
+        if self.prefetch > 0:
+            self._close_prefetcher()
+            if self._raw["next"]:
+                self._prefetcher = _PagePrefetcher(
+                    self._get_page, self._raw["next"], self.prefetch
+                )
+
+        return self._raw["results"]
+
+    def _get_page(self, url: str):
+        """
+        Get the raw JSON of a single page.
+
+        :param url: URL of the page.
+        :return: The page JSON, including the `results`.
+        :rtype: dict
+        """
         if self.payload:
-            response = self.api.post(self.url, data=self.payload, valid_codes=[200])
+            response = self.api.post(url, data=self.payload, valid_codes=[200])
         else:
-            response = self.api.get(self.url)
+            response = self.api.get(url)
 
         if "results" not in response:
             raise APIError(response)
 
-        self._raw = response
-        return self._raw["results"]
+        return response
+
+    def _iter_pages(self):
+        """
+        Iterate over the raw JSON of every page, starting with the current one.
+        Only the current page is held in memory and the paginator itself
+        stays on its current page.
+        """
+        if self._raw is None:
+            self.json()
+
+        page = self._raw
+        if self.prefetch > 0:
+            prefetcher = self._take_prefetcher(page["next"])
+            try:
+                while page:
+                    yield page
+                    page = prefetcher.get()
+            finally:
+                prefetcher.close()
+            return
+
+        while True:
+            yield page
+            next_url = page["next"]
+            if not next_url:
+                break
+            page = self._get_page(next_url)
+
+    def iter_json(self):
+        """
+        Iterate over the raw JSON of every result across all pages.
+        """
+        for page in self._iter_pages():
+            yield from page["results"]
+
+    def iter_objects(self):
+        """
+        Iterate over the objects generated from every result across all pages.
+        """
+        for page in self._iter_pages():
+            yield from self._generate_objects(page["results"])
+
+    def __iter__(self):
+        return self.iter_objects()
+
+    async def __aiter__(self):
+        """
+        Iterate over the objects of every result across all pages with `async for`.
+        Pages are fetched (and objects generated) in worker threads
+        so the event loop isn't blocked.
+        """
+        from cript.api.async_rest import run_in_session
+
+        pages = self._iter_pages()
+        try:
+            while True:
+                page = await run_in_session(self.api, next, pages, None)
+                if page is None:
+                    break
+                objs = await run_in_session(
+                    self.api, self._generate_objects, page["results"]
+                )
+                for obj in objs:
+                    yield obj
+        finally:
+            # The pages may still be fetched in a thread if the task was cancelled
+            with contextlib.suppress(ValueError):
+                pages.close()
 
     def objects(self):
         """
@@ -84,19 +291,34 @@ class Paginator:
         if self._raw is None:
             self.json()
 
-        objs_json = copy.deepcopy(self._raw["results"])
+        return self._generate_objects(self._raw["results"])
+
+    def _generate_objects(self, results: list):
+        """
+        Generate a list of objects from a list of raw JSON results.
+
+        :param results: The raw JSON results of a page.
+        :return: The generated objects.
+        :rtype: list
+        """
+        from cript.data_model.hydration import generate_nested_nodes
+
         obj_list = []
-        for obj_json in objs_json:
+        new_objs = []
+        for obj_json in results:
             # Use the local object if it's in memory
             # Otherwise, create a new object
-            local_obj = get_cached_node(obj_json["url"])
-            if local_obj:
-                obj = local_obj
-            else:
-                obj = create_node(self.node_class, obj_json)
-                obj._generate_nested_nodes(get_level=self.get_level)
+            obj, created = get_or_create_node(
+                obj_json["url"], partial(create_node, self.node_class, obj_json)
+            )
+            if created:
+                new_objs.append((obj, 0))
             obj_list.append(obj)
 
+        # Generate the nested nodes of the whole page at once
+        if new_objs:
+            generate_nested_nodes(new_objs, get_level=self.get_level, lazy=self.lazy)
+
         return obj_list
 
     def next_page(self):
@@ -107,12 +329,45 @@ class Paginator:
             self.json()
 
         next_url = self._raw["next"]
-        if next_url:
+        if not next_url:
+            raise InvalidPage("You're currently on the last page.")
+
+        if self.prefetch > 0:
+            # Use the page fetched in the background
+            self._prefetcher = self._take_prefetcher(next_url)
+            self._raw = self._prefetcher.get()
+            self.url = next_url
+        else:
             self.url = next_url
             self._raw = None
             self.json()
-        else:
-            raise InvalidPage("You're currently on the last page.")
+
+    def _take_prefetcher(self, url: str):
+        """
+        Take the background page fetcher if it's about to return the page at `url`.
+        Otherwise, start a new one.
+
+        :param url: URL of the next page.
+        :return: The page fetcher.
+        :rtype: cript.data_model.paginator._PagePrefetcher
+        """
+        prefetcher = self._prefetcher
+        self._prefetcher = None
+        if prefetcher is None or prefetcher.next_url != url:
+            if prefetcher is not None:
+                prefetcher.close()
+            prefetcher = _PagePrefetcher(self._get_page, url, self.prefetch)
+        return prefetcher
+
+    def _close_prefetcher(self, wait: bool = True):
+        """
+        Stop fetching pages in the background.
+
+        :param wait: Indicates whether to wait for the background thread to end.
+        """
+        if self._prefetcher is not None:
+            self._prefetcher.close(wait=wait)
+            self._prefetcher = None
 
     def previous_page(self):
         """
@@ -123,12 +378,52 @@ class Paginator:
 
         previous_url = self._raw["previous"]
         if previous_url:
+            self._close_prefetcher()
             self.url = previous_url
             self._raw = None
             self.json()
         else:
             raise InvalidPage("You're currently on the first page.")
 
+    def fetch_all(self, workers: int = 4, objects: bool = False):
+        """
+        Get every result of the query, fetching the pages concurrently.
+        Once the total count is known, the remaining pages are addressed
+        by `limit`/`offset` rather than by following each `next` link.
+
+        :param workers: The max number of pages fetched at the same time.
+        :param objects: Indicates whether to return objects instead of raw JSON.
+        :return: All results, in their original order.
+        :rtype: list
+        """
+        if workers < 1:
+            raise ValueError("The number of workers must be a positive integer.")
+
+        # Get the first page of the query
+        first_url = _set_query_params(self.url, offset=self.offset or "0")
+        if self._raw is not None and _get_offset(self.url) == _get_offset(first_url):
+            first_page = self._raw
+        else:
+            first_page = self._get_page(first_url)
+
+        # Use the actual page size in case the server capped the limit
+        results = list(first_page["results"])
+        page_size = len(results)
+        count = first_page["count"]
+        if first_page["next"] and page_size:
+            start = _get_offset(first_url)
+            urls = [
+                _set_query_params(first_url, limit=page_size, offset=offset)
+                for offset in range(start + page_size, count, page_size)
+            ]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for page in executor.map(self._get_page, urls):
+                    results.extend(page["results"])
+
+        if objects:
+            return self._generate_objects(results)
+        return results
+
     def count(self):
         """
         Get the total number of objects.
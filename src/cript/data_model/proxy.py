@@ -0,0 +1,127 @@
+from cript.cache import get_cached_node
+
+
+class NodeProxy:
+    """
+    Lightweight stand-in for a nested node that has not been fetched yet.
+    The real node is fetched from the API on first attribute access and
+    every attribute is then read from (and written to) that node.
+
+    A proxy passes `isinstance` checks for its node class and is sent to
+    the API as a plain URL without being fetched. Private attributes
+    of the node (i.e., starting with `_`) can't be read through a proxy.
+
+    :param url: URL of the node.
+    :param node_class: Class of the node.
+    """
+
+    __slots__ = ("_proxy_url", "_proxy_class", "_proxy_node")
+
+    def __init__(self, url: str, node_class):
+        object.__setattr__(self, "_proxy_url", url)
+        object.__setattr__(self, "_proxy_class", node_class)
+        object.__setattr__(self, "_proxy_node", None)
+
+    @property
+    def __class__(self):
+        return object.__getattribute__(self, "_proxy_class")
+
+    @property
+    def url(self):
+        return object.__getattribute__(self, "_proxy_url")
+
+    @property
+    def uid(self):
+        return self.url.rstrip("/").split("/")[-1]
+
+    @property
+    def node_name(self):
+        return self.__class__.node_name
+
+    @property
+    def slug(self):
+        return self.__class__.slug
+
+    @property
+    def is_resolved(self):
+        """Indicates whether the real node has been fetched."""
+        return object.__getattribute__(self, "_proxy_node") is not None
+
+    def resolve(self):
+        """
+        Get the real node, fetching it from the API if needed.
+
+        :return: The node.
+        :rtype: cript.data_model.nodes.BaseNode
+        """
+        node = object.__getattribute__(self, "_proxy_node")
+        if node is None:
+            node = get_cached_node(self.url)
+            if node is None:
+                node = self.__class__.get(url=self.url, lazy=True)
+            object.__setattr__(self, "_proxy_node", node)
+        return node
+
+    def _prep_for_upload(self, *args, **kwargs):
+        return self.url
+
+    def __getattr__(self, name):
+        # Private and special names (e.g., looked up by `hasattr`, copy or a debugger)
+        # are never node fields, so they don't fetch the node
+        if name.startswith("_"):
+            raise AttributeError(f"'NodeProxy' object has no attribute '{name}'")
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.resolve(), name)
+
+    def __bool__(self):
+        return True
+
+    def _get_loaded_node(self):
+        """Get the real node if it's in memory, without fetching it."""
+        node = object.__getattribute__(self, "_proxy_node")
+        if node is None:
+            node = get_cached_node(self.url)
+        return node
+
+    def __eq__(self, other):
+        # Equal to the node it stands for, like nodes compare by identity
+        # Any node with the same URL is in the node cache, so nothing is fetched
+        if type(other) is NodeProxy:
+            return self.url == other.url
+        node = self._get_loaded_node()
+        return node is not None and node is other
+
+    def __hash__(self):
+        # Hashed like the node it stands for, which has to be fetched if it isn't in memory
+        return hash(self.resolve())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __len__(self):
+        return len(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __getitem__(self, key):
+        return self.resolve()[key]
+
+    def __repr__(self):
+        # Never fetch the node just to display it (e.g., in logs or a debugger)
+        if not self.is_resolved:
+            return f"<NodeProxy url={self.url}>"
+        return repr(self.resolve())
+
+    def __str__(self):
+        if not self.is_resolved:
+            return f"<NodeProxy url={self.url}>"
+        return str(self.resolve())
@@ -1,5 +1,4 @@
 import abc
-import copy
 
 from cript.data_model.base import Base
 from cript.data_model.exceptions import AddNodeError, RemoveNodeError, UnsavedNodeError
@@ -7,6 +6,12 @@ from cript.data_model.nodes.base_node import BaseNode
 
 
 class BaseSubobject(Base, abc.ABC):
+    def __setattr__(self, name, value):
+        # Attributes set for the first time are being initialized
+        if name in self.__dict__ and "__" not in name:
+            self.__modified = True
+        super().__setattr__(name, value)
+
     def _prep_for_upload(self):
         """
         Convert a node into a dict that can be sent to the API.
@@ -14,17 +19,7 @@ class BaseSubobject(Base, abc.ABC):
         :return: The converted dict.
         :rtype: dict
         """
-        node_dict = copy.deepcopy(self._clean_dict())
-        for key, value in node_dict.items():
-            # Check if the value is a node
-            if hasattr(value, "_prep_for_upload"):
-                node_dict[key] = value._prep_for_upload()
-            elif isinstance(value, list):
-                for i in range(len(value)):
-                    if hasattr(value[i], "_prep_for_upload"):
-                        value[i] = value[i]._prep_for_upload()
-
-        return node_dict
+        return self._to_dict()
 
     def _add_node(self, node: Base, attr_name: str):
         """
@@ -38,6 +33,7 @@ class BaseSubobject(Base, abc.ABC):
 
         if hasattr(self, attr_name):
             getattr(self, attr_name).append(node)
+            self.__modified = True
         else:
             raise AddNodeError(node.node_name, self.node_name)
 
@@ -69,3 +65,39 @@ class BaseSubobject(Base, abc.ABC):
             raise RemoveNodeError(
                 f"{self.node_name} nodes do not contain {node.node_name} nodes."
             )
+        self.__modified = True
+
+    def _is_modified(self):
+        """
+        Check whether the subobject or a nested subobject
+        has been changed since it was loaded.
+
+        :return: Whether the subobject has been changed.
+        :rtype: bool
+        """
+        if self.__dict__.get("_BaseSubobject__modified"):
+            return True
+        return any(subobject._is_modified() for subobject in _subobjects(self))
+
+    def _reset_modified(self):
+        """
+        Mark the subobject and its nested subobjects as unchanged.
+        """
+        self.__modified = False
+        for subobject in _subobjects(self):
+            subobject._reset_modified()
+
+
+def _subobjects(obj):
+    """
+    Iterate over the subobjects directly nested in a node or subobject.
+
+    :param obj: The node or subobject.
+    """
+    for value in vars(obj).values():
+        if isinstance(value, BaseSubobject):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, BaseSubobject):
+                    yield item
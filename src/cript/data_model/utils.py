@@ -1,3 +1,7 @@
+import inspect
+from typing import Union, get_args, get_origin
+
+
 def auto_assign_group(group, parent):
     """
     Decide whether to inherit the group from a node's parent.
@@ -23,41 +27,181 @@ def set_node_attributes(node, obj_json):
         setattr(node, json_key, json_value)
 
 
+# Keys of API responses that are not passed to node constructors
+_COMMON_KEYS = ("url", "uid", "created_at", "updated_at")
+_IGNORED_KEYS = {
+    # Unused key for Python SDK, but used in web SDK
+    "can_edit",
+}
+_IGNORED_FILE_KEYS = {"data_dictionary", "data"}
+
+
 def create_node(node_class, obj_json):
     """
     Create a node with JSON returned from the API.
+    The JSON is left untouched so that it can be shared (e.g., a page of results).
 
     :param node_class: The class of the node to be created.
     :param obj_json: The JSON representation of the node object.
     :return: The created node.
     :rtype: cript.nodes.Base
     """
-    # Pop common attributes
-    url = obj_json.pop("url")
-    uid = obj_json.pop("uid")
-    created_at = obj_json.pop("created_at")
-    updated_at = obj_json.pop("updated_at")
+    return node_class.from_api_json(obj_json)
 
-    # Pop these keys out from api returned JSON for compatibility with Python SDK
-    if node_class.node_name == "File":
-        obj_json.pop("data_dictionary", None)
-        obj_json.pop("data", None)
 
-    # pop unused key for Python SDK, but used in web SDK
-    obj_json.pop("can_edit", None)
+def construct_node(node_class, obj_json):
+    """
+    Create a node with JSON returned from the API by calling its constructor,
+    i.e., with type checks and property setters.
+
+    :param node_class: The class of the node to be created.
+    :param obj_json: The JSON representation of the node object.
+    :return: The created node.
+    :rtype: cript.nodes.Base
+    """
+    skipped_keys = _IGNORED_KEYS.union(_COMMON_KEYS)
+
+    # Skip these keys from api returned JSON for compatibility with Python SDK
+    if node_class.node_name == "File":
+        skipped_keys |= _IGNORED_FILE_KEYS
 
     # Create node
-    node = node_class(**obj_json)
+    kwargs = {key: value for key, value in obj_json.items() if key not in skipped_keys}
+    node = node_class(**kwargs)
 
     # Replace common attributes
-    node.url = url
-    node.uid = uid
-    node.created_at = created_at
-    node.updated_at = updated_at
+    node.url = obj_json["url"]
+    node.uid = obj_json["uid"]
+    node.created_at = obj_json["created_at"]
+    node.updated_at = obj_json["updated_at"]
+
+    # Track changes from here on
+    node._reset_dirty()
+    node._cache_unique_key()
 
     return node
 
 
+# How `from_api_json` sets a field (see `get_api_json_fields()`)
+API_JSON_RAW = "raw"  # Assign the value to the attribute
+API_JSON_LIST = "list"  # Assign the value, replacing `None` with an empty list
+API_JSON_SETTER = "setter"  # Call the property setter (e.g., to create a `Paginator`)
+API_JSON_DEFAULT = "default"  # Ignore the value and assign the default
+API_JSON_SKIPPED = "skipped"  # Ignore the value
+
+# Fields of each node class by node class
+_api_json_fields = {}
+
+
+def _is_list_annotation(annotation):
+    """Check whether a type annotation is a list (or an optional list)."""
+    if get_origin(annotation) is list:
+        return True
+    return get_origin(annotation) is Union and any(
+        get_origin(arg) is list for arg in get_args(annotation)
+    )
+
+
+def get_api_json_fields(node_class):
+    """
+    Get how `from_api_json` sets each field of a node class.
+    The fields are derived once from the constructor parameters of the class
+    and its base classes.
+
+    :param node_class: The node class.
+    :return: The fields mapping JSON keys to tuples of the attribute name,
+             how it's set and its default value, and the set of required keys.
+    :rtype: tuple
+    """
+    try:
+        return _api_json_fields[node_class]
+    except KeyError:
+        pass
+
+    # Constructor parameters from the base class to the node class
+    signatures = []
+    for cls in node_class.__mro__:
+        if "__init__" not in vars(cls):
+            continue
+        parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+        signatures.insert(0, parameters)
+        if not any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+            break
+
+    raw_fields = node_class._api_json_raw_fields
+    ignored_keys = set(_IGNORED_KEYS)
+    if node_class.node_name == "File":
+        ignored_keys |= _IGNORED_FILE_KEYS
+
+    fields = {key: (None, API_JSON_SKIPPED, None) for key in ignored_keys}
+    required = set()
+    for parameters in signatures:
+        for parameter in parameters:
+            name = parameter.name
+            if parameter.kind in (
+                inspect.Parameter.VAR_KEYWORD,
+                inspect.Parameter.VAR_POSITIONAL,
+            ):
+                continue
+
+            default = parameter.default
+            if default is inspect.Parameter.empty:
+                required.add(name)
+                default = None
+            else:
+                required.discard(name)
+
+            if name in ignored_keys:
+                fields[name] = (name, API_JSON_DEFAULT, default)
+            elif isinstance(getattr(node_class, name, None), property):
+                if name in raw_fields:
+                    fields[name] = (f"_{name}", API_JSON_RAW, default)
+                else:
+                    fields[name] = (name, API_JSON_SETTER, default)
+            elif default is None and _is_list_annotation(parameter.annotation):
+                fields[name] = (name, API_JSON_LIST, default)
+            else:
+                fields[name] = (name, API_JSON_RAW, default)
+
+    _api_json_fields[node_class] = fields, frozenset(required)
+    return _api_json_fields[node_class]
+
+
+# Data model classes by node name (lowercase, without underscores) and by alternative name
+_class_registry = None
+
+
+def _build_class_registry(classes):
+    """
+    Map the node names and alternative names of data model classes to the classes.
+
+    :param classes: The data model classes.
+    :return: The classes by node name and by alternative name.
+    :rtype: tuple[dict, dict]
+    """
+    by_name = {}
+    by_alt_name = {}
+    for cls in classes:
+        name = cls.node_name.lower()
+        if by_name.setdefault(name, cls) is not cls:
+            raise ValueError(
+                f"{cls.__name__} and {by_name[name].__name__} have the same node name."
+            )
+
+    for cls in classes:
+        for alt_name in getattr(cls, "alt_names", []):
+            other = by_alt_name.setdefault(alt_name, cls)
+            if other is cls:
+                # Node names take precedence in lookups, so they can't be shadowed
+                other = by_name.get(alt_name.replace("_", "").lower(), cls)
+            if other is not cls:
+                raise ValueError(
+                    f"The alternative name '{alt_name}' of {cls.__name__} "
+                    f"is ambiguous with {other.__name__}."
+                )
+    return by_name, by_alt_name
+
+
 def get_data_model_class(key: str):
     """
     Get the correct data model class associated with a given key.
@@ -66,15 +210,14 @@ def get_data_model_class(key: str):
     :return: The correct class.
     :rtype: cript.nodes.Base
     """
-    from cript import DATA_MODEL_CLASSES
-
-    for cls in DATA_MODEL_CLASSES:
-        # Use node name
-        if cls.node_name.lower() == key.replace("_", "").lower():
-            return cls
-        # Use alternative names
-        if hasattr(cls, "alt_names"):
-            for alt_name in cls.alt_names:
-                if alt_name == key:
-                    return cls
-    return None
+    global _class_registry
+    if _class_registry is None:
+        from cript import DATA_MODEL_CLASSES
+
+        _class_registry = _build_class_registry(DATA_MODEL_CLASSES)
+
+    by_name, by_alt_name = _class_registry
+    cls = by_name.get(key.replace("_", "").lower())
+    if cls is None:
+        cls = by_alt_name.get(key)
+    return cls
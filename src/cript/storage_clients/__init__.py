@@ -1,2 +1,11 @@
-from .globus import GlobusClient
-from .s3 import AmazonS3Client
+def __getattr__(name: str):
+    """Import the storage clients on first use since their dependencies are slow to load."""
+    if name == "GlobusClient":
+        from cript.storage_clients.globus import GlobusClient
+
+        return GlobusClient
+    if name == "AmazonS3Client":
+        from cript.storage_clients.s3 import AmazonS3Client
+
+        return AmazonS3Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
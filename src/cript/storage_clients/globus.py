@@ -19,6 +19,7 @@ class GlobusClient:
     def __init__(self, api):
         self.api = api
         self.session = self.api.session
+        self.storage_session = self.api.storage_session
         self.url = self.api.url
         self.endpoint_id = self.api.storage_info["endpoint_id"]
         self.native_client_id = self.api.storage_info["native_client_id"]
@@ -47,7 +48,7 @@ class GlobusClient:
         # Perform transfer
         https_auth_token = self.tokens["https_auth_token"]
         headers = {"Authorization": f"Bearer {https_auth_token}"}
-        response = requests.get(
+        response = self.storage_session.get(
             url=globus_url,
             headers=headers,
             allow_redirects=True,
@@ -103,7 +104,7 @@ class GlobusClient:
         https_auth_token = self.tokens["https_auth_token"]
         headers = {"Authorization": f"Bearer {https_auth_token}"}
         try:
-            response = requests.put(
+            response = self.storage_session.put(
                 url=f"{https_server}/{self.storage_path}{file_uid}/{unique_file_name}",
                 data=open(node.source, "rb"),
                 headers=headers,
@@ -1,8 +1,6 @@
 import json
 from logging import getLogger
 
-import requests
-
 from cript.storage_clients.exceptions import FileUploadError
 
 logger = getLogger(__name__)
@@ -12,6 +10,7 @@ class AmazonS3Client:
     def __init__(self, api):
         self.api = api
         self.session = api.session
+        self.storage_session = api.storage_session
         self.url = api.url
 
     def single_file_upload(self, file_uid, node):
@@ -35,7 +34,7 @@ class AmazonS3Client:
             logger.info(f"Upload of file {file_uid} to AWS S3 in progress.")
             url = json.loads(response.content)
             files = {"file": open(node.source, "rb")}
-            response = requests.put(url=url, files=files)
+            response = self.storage_session.put(url=url, files=files)
             if response.status_code != 200:
                 raise FileUploadError
         else:
@@ -85,7 +84,7 @@ class AmazonS3Client:
                 # Upload file chunk
                 if response.status_code == 200:
                     signed_url = json.loads(response.content)
-                    response = requests.put(url=signed_url, data=file_data)
+                    response = self.storage_session.put(url=signed_url, data=file_data)
                     if response.status_code == 200:
                         etag = response.headers["ETag"]
                         parts.append({"ETag": etag, "PartNumber": len(parts) + 1})
@@ -0,0 +1,225 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import cript
+from cript.api.base import APIBase
+
+PAGE_SIZE = 2
+DELAY = 0.2
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    A minimal stand-in for the CRIPT API and its file storage, storing nodes in memory.
+    Paths containing "delay" are answered after `DELAY` seconds.
+    """
+
+    protocol_version = "HTTP/1.1"
+    nodes = {}
+    # (method, path, client port, headers) of every request
+    requests = []
+    # Status codes answered (with a `Retry-After` header) instead of the next responses
+    failures = []
+    # Number of delayed requests being answered and the max reached at once
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, code, obj, headers=None):
+        body = json.dumps(obj).encode()
+        self.send_response(code)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def node_url(self, slug, uid):
+        return f"http://{self.headers['Host']}/api/{slug}/{uid}/"
+
+    def record(self):
+        """Record a request and answer it if it should fail."""
+        self.requests.append(
+            (self.command, self.path, self.client_address[1], dict(self.headers))
+        )
+        if "delay" in self.path:
+            cls = type(self)
+            with cls.lock:
+                cls.active += 1
+                cls.max_active = max(cls.max_active, cls.active)
+            time.sleep(DELAY)
+            with cls.lock:
+                cls.active -= 1
+        if self.failures:
+            self.read_body()
+            self.send(
+                self.failures.pop(0), {"detail": "Failure."}, {"Retry-After": "0"}
+            )
+            return True
+        return False
+
+    def do_GET(self):
+        if self.record():
+            return
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if parts[1] == "session-info":
+            return self.send(
+                200,
+                {
+                    "latest_version": cript.__api_version__,
+                    "user_info": {
+                        "url": self.node_url("user", "0"),
+                        "uid": "0",
+                        "created_at": "now",
+                        "updated_at": "now",
+                        "username": "user",
+                    },
+                    "storage_info": {"provider": "s3"},
+                },
+            )
+        node = self.nodes.get(parts[2])
+        if not node:
+            return self.send(404, {"detail": "Not found."})
+
+        etag = '"%s"' % hashlib.sha256(json.dumps(node).encode()).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send(200, node, {"ETag": etag})
+
+    def do_POST(self):
+        if self.record():
+            return
+        parts = urlparse(self.path).path.strip("/").split("/")
+        query = json.loads(self.read_body())
+        if parts[1] == "s3-signed-url":
+            return self.send(
+                200, f"http://{self.headers['Host']}/storage/{uuid.uuid4()}"
+            )
+        if parts[1] == "search":
+            results = [
+                node
+                for node in self.nodes.values()
+                if node["url"].split("/")[-3] == parts[2]
+                and all(node.get(key) == value for key, value in query.items())
+            ]
+            offset = int(parse_qs(urlparse(self.path).query).get("offset", [0])[0])
+            next_url = None
+            if offset + PAGE_SIZE < len(results):
+                next_url = self.node_url("search", parts[2])
+                next_url += f"?limit={PAGE_SIZE}&offset={offset + PAGE_SIZE}"
+            return self.send(
+                200,
+                {
+                    "count": len(results),
+                    "next": next_url,
+                    "previous": None,
+                    "results": results[offset : offset + PAGE_SIZE],
+                },
+            )
+        uid = str(uuid.uuid4())
+        query.update(
+            url=self.node_url(parts[1], uid),
+            uid=uid,
+            created_at="now",
+            updated_at="now",
+        )
+        self.nodes[uid] = query
+        self.send(201, query)
+
+    def do_PUT(self):
+        if self.record():
+            return
+        if self.path.startswith("/storage/"):
+            self.read_body()
+            return self.send(200, None, {"ETag": '"etag"'})
+        self.do_PATCH(recorded=True)
+
+    def do_PATCH(self, recorded=False):
+        if not recorded and self.record():
+            return
+        parts = urlparse(self.path).path.strip("/").split("/")
+        body = json.loads(self.read_body() or "{}")
+        node = self.nodes.get(parts[2])
+        if not node:
+            return self.send(404, {"detail": "Not found."})
+        node.update(body, url=node["url"], uid=node["uid"], updated_at="later")
+        self.send(200, node)
+
+    def do_DELETE(self):
+        if self.record():
+            return
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if self.nodes.pop(parts[2], None) is None:
+            return self.send(404, {"detail": "Not found."})
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks unless they're requested (e.g., `CRIPT_BENCHMARKS=1 pytest`)."""
+    if os.environ.get("CRIPT_BENCHMARKS"):
+        return
+    skip = pytest.mark.skip(reason="Set CRIPT_BENCHMARKS=1 to run the benchmarks.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="module")
+def host():
+    """Start a stand-in CRIPT server and return its host."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    latest_session = APIBase.latest_session
+    yield f"127.0.0.1:{server.server_address[1]}"
+    APIBase.latest_session = latest_session
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def server_requests():
+    """The requests received by the stand-in server during a test."""
+    StandInHandler.requests.clear()
+    StandInHandler.failures.clear()
+    return StandInHandler.requests
+
+
+@pytest.fixture
+def stand_in():
+    """The stand-in server's request handler, whose class attributes hold its state."""
+    StandInHandler.nodes.clear()
+    StandInHandler.requests.clear()
+    StandInHandler.failures.clear()
+    StandInHandler.max_active = 0
+    yield StandInHandler
+    StandInHandler.failures.clear()
+
+
+@pytest.fixture
+def server_failures():
+    """Status codes the stand-in server answers instead of the next responses."""
+    StandInHandler.failures.clear()
+    yield StandInHandler.failures
+    StandInHandler.failures.clear()
@@ -0,0 +1,99 @@
+import inspect
+from typing import get_args
+from unittest import mock
+
+import pytest
+
+import cript
+from cript.data_model.nodes.base_node import BaseNode
+from cript.data_model.paginator import Paginator
+from cript.data_model.utils import construct_node
+
+HOST = "https://api.example.org/api/v1"
+
+NODE_CLASSES = [cls for cls in cript.DATA_MODEL_CLASSES if issubclass(cls, BaseNode)]
+
+
+def make_json(node_class, nulls=False, **values):
+    """
+    Make JSON like the API returns, with every field set.
+    With `nulls`, the unannotated or optional fields that default to `None` are `null`
+    (e.g., lists that the constructors replace by empty lists).
+    """
+    obj_json = {
+        "url": f"{HOST}/{node_class.slug}/1234/",
+        "uid": "1234",
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-02T00:00:00Z",
+        "can_edit": True,
+        "public": True,
+    }
+    for name, parameter in inspect.signature(node_class).parameters.items():
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD or name in obj_json:
+            continue
+        annotation = parameter.annotation
+        nullable = annotation is parameter.empty or type(None) in get_args(annotation)
+        if nulls and nullable and parameter.default is None:
+            obj_json[name] = None
+        elif "list" in str(annotation):
+            obj_json[name] = []
+        elif int in get_args(annotation):
+            obj_json[name] = 1
+        elif type(None) in get_args(annotation):
+            obj_json[name] = None
+        else:
+            obj_json[name] = f"{HOST}/{name}/5678/"
+    obj_json.update(values)
+    return obj_json
+
+
+def get_state(node):
+    """Get the attributes of a node, comparing paginators by URL."""
+    return {
+        key: (Paginator, value.url, value.node_class)
+        if isinstance(value, Paginator)
+        else value
+        for key, value in vars(node).items()
+    }
+
+
+@pytest.mark.parametrize("nulls", [False, True], ids=["values", "nulls"])
+@pytest.mark.parametrize("node_class", NODE_CLASSES, ids=lambda cls: cls.node_name)
+def test_from_api_json_matches_constructor(node_class, nulls):
+    obj_json = make_json(node_class, nulls=nulls)
+    if node_class.node_name == "File":
+        obj_json.update(source="https://example.org/file.csv", data=[])
+    expected = get_state(construct_node(node_class, obj_json))
+
+    with mock.patch("cript.data_model.nodes.base_node.construct_node") as constructor:
+        node = node_class.from_api_json(obj_json)
+    constructor.assert_not_called()
+    assert get_state(node) == expected
+    assert node.dirty_fields == set()
+    assert cript.cache.get_cached_node(obj_json["url"]) is node
+
+
+def test_from_api_json_trusts_file_source(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b")
+    obj_json = make_json(cript.File, source=str(path), checksum="abc", name="x.csv")
+    node = cript.File.from_api_json(obj_json)
+    assert (node.source, node.checksum, node.name) == (str(path), "abc", "x.csv")
+
+    obj_json = make_json(cript.File, source="missing.csv")
+    assert cript.File.from_api_json(obj_json).source == "missing.csv"
+
+
+def test_from_api_json_falls_back_to_constructor():
+    obj_json = make_json(cript.Material, unknown="value")
+    with pytest.raises(TypeError, match="unknown"):
+        cript.Material.from_api_json(obj_json)
+
+    obj_json = make_json(cript.Material)
+    del obj_json["name"]
+    with pytest.raises(TypeError, match="name"):
+        cript.Material.from_api_json(obj_json)
+
+    obj_json = make_json(cript.Material, keywords=["a"])
+    del obj_json["notes"]
+    assert cript.Material.from_api_json(obj_json).notes is None
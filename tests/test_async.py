@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+import pytest
+
+import cript
+from cript.api.exceptions import APIError
+from cript.data_model.paginator import Paginator
+
+
+def test_async_api(host, stand_in):
+    async def main():
+        async with await cript.AsyncAPI.connect(host, "token", tls=False) as api:
+            with cript.use_api_session(api.api):
+                group = cript.Group(name="group")
+                await group.asave()
+                project = cript.Project(name="project", group=group)
+                await project.asave()
+                materials = [
+                    cript.Material(project=project, name=f"material {i}")
+                    for i in range(5)
+                ]
+                await asyncio.gather(*(material.asave() for material in materials))
+
+                # Nodes in memory are reused
+                material = await cript.Material.aget(url=materials[0].url)
+                assert material is materials[0]
+
+                paginator = await cript.Material.asearch(project=project.url)
+                found = [material async for material in paginator]
+                assert {id(m) for m in found} == {id(m) for m in materials}
+
+            # Requests are sent concurrently
+            responses = await asyncio.gather(
+                *(api.get(f"{api.url}/material/delay-{i}/") for i in range(4)),
+                return_exceptions=True,
+            )
+            assert all(isinstance(r, APIError) for r in responses)
+            assert stand_in.max_active == 4
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_node_operations_share_session_threads(host, stand_in, max_workers):
+    names = [f"delay-{max_workers}-{i}" for i in range(4)]
+
+    async def main():
+        async with await cript.AsyncAPI.connect(
+            host, "token", tls=False, max_workers=max_workers
+        ) as api:
+            project = f"{api.url}/project/project/"
+            for name in names:
+                stand_in.nodes[name] = {
+                    "url": f"{api.url}/material/{name}/",
+                    "uid": name,
+                    "created_at": "now",
+                    "updated_at": "now",
+                    "project": project,
+                    "group": f"{api.url}/group/group/",
+                    "name": name,
+                }
+            with cript.use_api_session(api.api):
+                materials = await asyncio.gather(
+                    *(
+                        cript.Material.aget(url=f"{api.url}/material/{name}/")
+                        for name in names
+                    )
+                )
+                assert [material.name for material in materials] == names
+                assert stand_in.max_active == max_workers
+
+                # Including pages of search results
+                stand_in.max_active = 0
+                paginators = [
+                    Paginator(
+                        url=f"{api.api.search_url}/material/?delay=1",
+                        node_name="Material",
+                        payload=json.dumps({"name": name}),
+                        get_level=0,
+                    )
+                    for name in names
+                ]
+                await asyncio.gather(
+                    *(anext(aiter(paginator)) for paginator in paginators)
+                )
+                assert stand_in.max_active == max_workers
+
+    asyncio.run(main())
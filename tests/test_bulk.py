@@ -0,0 +1,101 @@
+import itertools
+import json
+from unittest import mock
+
+import pytest
+
+import cript
+from cript.data_model.bulk import plan_save
+from cript.data_model.exceptions import CircularDependencyError
+
+HOST = "https://criptapp.org/api"
+GROUP_URL = f"{HOST}/group/00000000-0000-4000-8000-000000000000/"
+
+
+def build_experiment(n_processes):
+    project = cript.Project(name="project", group=GROUP_URL)
+    collection = cript.Collection(project=project, name="collection")
+    experiment = cript.Experiment(collection=collection, name="experiment")
+    materials = [
+        cript.Material(project=project, name=f"material {i}")
+        for i in range(n_processes)
+    ]
+    processes = [
+        cript.Process(
+            experiment=experiment,
+            name=f"process {i}",
+            type="multistep",
+            ingredients=[
+                cript.Ingredient(
+                    material=materials[i],
+                    keyword="solvent",
+                    quantities=[cript.Quantity(key="mass", value=1, unit="g")],
+                )
+            ],
+        )
+        for i in range(n_processes)
+    ]
+    return project, collection, experiment, materials, processes
+
+
+def test_plan_save_waves():
+    project, collection, experiment, materials, processes = build_experiment(100)
+
+    waves = plan_save(processes)
+
+    assert len(waves) == 4
+    assert waves[0] == [project]
+    assert {id(node) for node in waves[1]} == {
+        id(node) for node in [collection, *materials]
+    }
+    assert waves[2] == [experiment]
+    assert {id(node) for node in waves[3]} == {id(node) for node in processes}
+
+
+def test_plan_save_skips_saved_nodes():
+    project, collection, experiment, materials, processes = build_experiment(3)
+    project.url = f"{HOST}/project/00000000-0000-4000-8000-000000000000/"
+
+    waves = plan_save([experiment])
+
+    assert waves == [[collection], [experiment]]
+
+
+def test_plan_save_circular_dependency():
+    first = cript.Material(project="project", name="first", group=GROUP_URL)
+    second = cript.Material(
+        project="project", name="second", components=[first], group=GROUP_URL
+    )
+    first.components = [second]
+
+    with pytest.raises(CircularDependencyError):
+        plan_save([first])
+
+
+def test_save_all_trusts_write_responses():
+    project, collection, experiment, materials, processes = build_experiment(5)
+    responses = {}
+    uids = itertools.count()
+
+    def post(url, data, **kwargs):
+        node_json = json.loads(data)
+        uid = f"{next(uids):08d}-0000-4000-8000-000000000000"
+        node_json.update(
+            url=f"{url}{uid}/", uid=uid, created_at="now", updated_at="now"
+        )
+        responses[node_json["url"]] = node_json
+        return node_json
+
+    api = mock.Mock(url=HOST)
+    api.post.side_effect = post
+    with mock.patch(
+        "cript.data_model.nodes.base_node.get_cached_api_session", return_value=api
+    ), mock.patch(
+        "cript.data_model.hydration.get_cached_api_session", return_value=api
+    ):
+        cript.save_all(processes, workers=4)
+
+    assert api.post.call_count == 3 + 2 * len(processes)
+    api.get.assert_not_called()
+    assert all(process.url in responses for process in processes)
+    assert processes[0].experiment is experiment
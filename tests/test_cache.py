@@ -0,0 +1,253 @@
+import asyncio
+import gc
+import sys
+import threading
+import time
+import timeit
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+import cript
+from cript.api.base import APIBase
+from cript.cache import (
+    cache_api_session,
+    get_cached_api_session,
+    get_cached_node,
+    get_or_create_node,
+)
+from cript.data_model.nodes.base_node import BaseNode
+from cript.data_model.utils import set_node_attributes
+
+HOST = "https://criptapp.org/api"
+
+
+def make_url(i, slug="material"):
+    return f"{HOST}/{slug}/{i:08d}-0000-4000-8000-000000000000/"
+
+
+def test_get_cached_node_by_url_and_uid():
+    node = BaseNode(url=make_url(1), uid="uid-1")
+
+    assert get_cached_node(make_url(1)) is node
+    assert get_cached_node(make_url(1).rstrip("/")) is node
+    assert get_cached_node(make_url(1).replace("/api", "")) is node
+    assert get_cached_node(uid="uid-1") is node
+    assert get_cached_node(make_url(2)) is None
+
+
+def test_cache_follows_url_changes():
+    node = BaseNode()
+    assert get_cached_node(make_url(3)) is None
+
+    # e.g., save()
+    set_node_attributes(node, {"url": make_url(3), "uid": "uid-3"})
+    assert get_cached_node(make_url(3)) is node
+
+    # e.g., update_existing=True pointing the node at another URL
+    node.url = make_url(4)
+    assert get_cached_node(make_url(3)) is None
+    assert get_cached_node(make_url(4)) is node
+
+    # e.g., delete()
+    api = mock.Mock()
+    with mock.patch(
+        "cript.data_model.nodes.base_node.get_cached_api_session", return_value=api
+    ):
+        node.delete()
+    api.delete.assert_called_once_with(make_url(4))
+    assert get_cached_node(make_url(4)) is None
+    assert get_cached_node(uid="uid-3") is None
+
+
+def test_cache_does_not_keep_nodes_alive():
+    node = BaseNode(url=make_url(5))
+    del node
+    gc.collect()
+    assert get_cached_node(make_url(5)) is None
+
+
+def test_get_returns_cached_node_without_request():
+    material = cript.Material(
+        project=make_url(6, "project"), name="water", group=make_url(6, "group")
+    )
+    material.url = make_url(6)
+    with mock.patch(
+        "cript.data_model.nodes.base_node.get_cached_api_session"
+    ) as get_session:
+        assert cript.Material.get(url=make_url(6)) is material
+    get_session.assert_not_called()
+
+
+class ScanFreeCache(weakref.WeakValueDictionary):
+    """A node cache that fails if it's iterated instead of looked up by key."""
+
+    def __iter__(self):
+        raise AssertionError("The node cache was scanned.")
+
+    keys = values = items = itervaluerefs = valuerefs = __iter__
+
+
+def test_get_cached_node_does_not_scan(monkeypatch):
+    """Lookups are dictionary lookups, whatever the cache size."""
+    monkeypatch.setattr(cript.cache, "node_cache", ScanFreeCache())
+    nodes = [BaseNode(url=make_url(i), uid=f"uid-{i}") for i in range(1000)]
+
+    assert get_cached_node(make_url(999)) is nodes[-1]
+    assert get_cached_node(make_url(999).replace("/api", "")) is nodes[-1]
+    assert get_cached_node(make_url(1000)) is None
+    assert get_cached_node(uid="uid-0") is nodes[0]
+    assert len(cript.cache.node_cache) == 1000
+
+
+@pytest.mark.benchmark
+def test_get_cached_node_benchmark():
+    """Lookups should take constant time regardless of the cache size."""
+
+    def lookup_time(n_nodes):
+        urls = [make_url(i) for i in range(0, n_nodes, n_nodes // 100)]
+        return min(
+            timeit.repeat(
+                lambda: [get_cached_node(url) for url in urls], number=20, repeat=5
+            )
+        )
+
+    nodes = [BaseNode(url=make_url(i)) for i in range(1000)]
+    small = lookup_time(len(nodes))
+
+    nodes += [BaseNode(url=make_url(i)) for i in range(1000, 100_000)]
+    large = lookup_time(len(nodes))
+
+    assert get_cached_node(make_url(99_999)) is nodes[-1]
+    assert large < small * 5
+
+
+def test_concurrent_get_stress():
+    """Threads getting the same nodes should share one object per URL."""
+    n_urls = 50
+
+    def get(url):
+        time.sleep(0.001)  # e.g., network latency
+        return {
+            "url": url,
+            "uid": url.split("/")[-2],
+            "created_at": "now",
+            "updated_at": "now",
+            "project": make_url(0, "project"),
+            "group": make_url(0, "group"),
+            "name": url,
+        }
+
+    api = mock.Mock(url=HOST)
+    api.get.side_effect = get
+    stop = threading.Event()
+
+    def churn():
+        # Construct, rename and drop other nodes while the cache is being read
+        i = 0
+        while not stop.is_set():
+            node = BaseNode(url=make_url(10**6 + i % 1000, "data"))
+            node.url = make_url(10**6 + i % 1000, "file")
+            i += 1
+
+    def get_all(_):
+        return [
+            cript.Material.get(url=make_url(10**5 + i), get_level=0)
+            for i in range(n_urls)
+        ]
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with mock.patch(
+            "cript.data_model.nodes.base_node.get_cached_api_session", return_value=api
+        ), ThreadPoolExecutor(max_workers=16) as executor:
+            churners = [executor.submit(churn) for _ in range(4)]
+            results = list(executor.map(get_all, range(32)))
+            stop.set()
+            for churner in churners:
+                churner.result()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    for i in range(n_urls):
+        assert len({id(nodes[i]) for nodes in results}) == 1
+        assert get_cached_node(make_url(10**5 + i)) is results[0][i]
+
+
+def test_get_or_create_node_outside_lock():
+    url = make_url(7)
+    creating = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def create():
+        calls.append(url)
+        creating.set()
+        release.wait(timeout=5)
+        return BaseNode(url=url)
+
+    def use_cache():
+        other = BaseNode(url=make_url(8))
+        return get_cached_node(make_url(8)) is other
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        first = executor.submit(get_or_create_node, url, create)
+        creating.wait(timeout=5)
+        others = [executor.submit(get_or_create_node, url, create) for _ in range(3)]
+
+        # The cache can be used while the node is being created
+        assert executor.submit(use_cache).result(timeout=1)
+        release.set()
+        results = [future.result() for future in [first] + others]
+
+    # Created once and shared
+    node = get_cached_node(url)
+    assert results == [(node, True)] + [(node, False)] * 3
+    assert calls == [url]
+
+
+def test_get_or_create_node_after_failure():
+    url = make_url(9)
+
+    def fail():
+        raise ValueError("Invalid JSON.")
+
+    with pytest.raises(ValueError):
+        get_or_create_node(url, fail)
+    node, created = get_or_create_node(url, lambda: BaseNode(url=url))
+    assert created and get_cached_node(url) is node
+
+
+def test_active_api_session_is_scoped_to_context():
+    first = mock.Mock(host="first.org")
+    second = mock.Mock(host="second.org")
+    barrier = threading.Barrier(2)
+
+    def job(api):
+        with cript.use_api_session(api):
+            barrier.wait()
+            assert get_cached_api_session() is api
+            # URLs of other hosts still use their own session
+            assert get_cached_api_session("https://first.org/api/material/1/") is first
+
+    async def task(api):
+        with cript.use_api_session(api):
+            await asyncio.sleep(0)
+            return get_cached_api_session()
+
+    async def main():
+        return await asyncio.gather(task(first), task(second))
+
+    latest_session = APIBase.latest_session
+    cache_api_session(first)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(job, [first, second]))
+
+        assert asyncio.run(main()) == [first, second]
+        assert get_cached_api_session() is first
+    finally:
+        APIBase.latest_session = latest_session
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from cript import codec
+
+orjson = pytest.importorskip("orjson")
+
+VALUES = [
+    {"url": "https://criptapp.org/api/material/1/", "notes": None, "public": False},
+    {"key": "density", "value": 1.0, "unit": "g/ml", "set_id": 2},
+    {"big": 1e16, "small": 1e-05, "tiny": 2.5e-07, "plain": 12345.678, "neg": -0.0},
+    {"text": "1e5 0.00001", "nested": [[1, 2], {"a": [True, None]}]},
+    {"name": "2,2,2-trifluoroethanol", "symbol": "°C", "emoji": "\U0001f600"},
+    {"control": '\x00\x1f\t\n"\\/ '},
+    {"delete": "a\x7fb"},
+    {chr(i): chr(i) for i in range(128)},
+    {"integer": 2**64, "negative": -(2**63) - 1},
+    {1: "non-string key"},
+    [],
+    "",
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_dumps_matches_stdlib(value):
+    assert codec.ORJSONCodec().dumps(value) == codec.JSONCodec().dumps(value)
+    assert codec.ORJSONCodec().dumps(value, indent=4) == json.dumps(value, indent=4)
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_loads_matches_stdlib(value):
+    data = json.dumps(value)
+    for raw in (data, data.encode()):
+        result = codec.ORJSONCodec().loads(raw)
+        assert result == json.loads(raw)
+        assert type(result) is type(json.loads(raw))
+
+
+def test_loads_non_standard_json():
+    assert codec.ORJSONCodec().loads("[123456789012345678901234567890]") == [
+        123456789012345678901234567890
+    ]
+    assert codec.ORJSONCodec().loads('{"a": Infinity}') == {"a": float("inf")}
+    with pytest.raises(json.JSONDecodeError):
+        codec.ORJSONCodec().loads("{")
+
+
+def test_set_codec():
+    try:
+        codec.set_codec("json")
+        assert codec.get_codec().name == "json"
+        codec.set_codec()
+        assert codec.get_codec().name == "orjson"
+        with pytest.raises(ValueError):
+            codec.set_codec("yaml")
+    finally:
+        codec.set_codec()
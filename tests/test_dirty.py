@@ -0,0 +1,83 @@
+import json
+from unittest import mock
+
+import cript
+
+HOST = "https://criptapp.org/api"
+URL = f"{HOST}/material/00000000-0000-4000-8000-000000000001/"
+
+
+def load_material():
+    material = cript.Material(
+        project=f"{HOST}/project/00000000-0000-4000-8000-000000000000/",
+        group=f"{HOST}/group/00000000-0000-4000-8000-000000000000/",
+        name="water",
+        properties=[cript.Property(key="density", value=1.0, unit="g/ml")],
+    )
+    material.url = URL
+    # e.g., after the node was loaded or saved
+    material._reset_dirty()
+    return material
+
+
+def save(node):
+    """Save a node and return the payload sent via PATCH (or `None`)."""
+    api = mock.Mock(url=HOST)
+    api.patch.side_effect = lambda url, data, **kwargs: {"url": url}
+    with mock.patch(
+        "cript.data_model.nodes.base_node.get_cached_api_session", return_value=api
+    ), mock.patch.object(type(node), "_generate_nested_nodes"):
+        node.save()
+    api.put.assert_not_called()
+    if api.patch.called:
+        return json.loads(api.patch.call_args.kwargs["data"])
+    return None
+
+
+def test_new_nodes_are_not_tracked():
+    material = cript.Material(project="project", name="water", group="group")
+    assert material.dirty_fields is None
+
+
+def test_save_without_changes_is_skipped():
+    material = load_material()
+    assert material.dirty_fields == set()
+    assert save(material) is None
+
+
+def test_save_sends_assigned_fields():
+    material = load_material()
+    material.name = "ice"
+    material.notes = "frozen"
+    assert save(material) == {"name": "ice", "notes": "frozen"}
+    assert material.dirty_fields == set()
+
+
+def test_save_sends_changed_subobjects():
+    material = load_material()
+    material.properties[0].value = 0.92
+    assert material.dirty_fields == {"properties"}
+    assert save(material)["properties"][0]["value"] == 0.92
+
+
+def test_save_sends_changed_lists():
+    material = load_material()
+    material.add_property(cript.Property(key="color", value="colorless"))
+    assert list(save(material)) == ["properties"]
+
+    material = load_material()
+    material.properties.append(cript.Property(key="phase", value="liquid"))
+    assert list(save(material)) == ["properties"]
+
+    material = load_material()
+    material.remove_property(material.properties[0])
+    assert save(material) == {"properties": []}
+
+
+def test_mark_dirty():
+    material = load_material()
+    material.properties[0].conditions.append(
+        cript.Condition(key="temperature", value=4, unit="degC")
+    )
+    material.mark_dirty("properties")
+    assert list(save(material)) == ["properties"]
@@ -0,0 +1,34 @@
+import cript
+from cript.storage_clients import AmazonS3Client
+
+
+def count_handshakes(server_requests):
+    return sum("session-info" in path for _, path, _, _ in server_requests)
+
+
+def test_lazy_handshake(host, server_requests):
+    api = cript.API(host, "token", tls=False, lazy=True)
+    assert count_handshakes(server_requests) == 0
+
+    assert api.user.username == "user"
+    assert isinstance(api.storage_client, AmazonS3Client)
+    assert api.storage_info == {"provider": "s3"}
+    assert count_handshakes(server_requests) == 1
+
+
+def test_cached_session_info(host, server_requests, tmp_path):
+    cript.API(host, "token", tls=False, session_info_dir=tmp_path)
+    assert count_handshakes(server_requests) == 1
+
+    api = cript.API(host, "token", tls=False, session_info_dir=tmp_path)
+    assert api.user.username == "user"
+    assert isinstance(api.storage_client, AmazonS3Client)
+    assert count_handshakes(server_requests) == 1
+
+    # Cached per token
+    cript.API(host, "other token", tls=False, session_info_dir=tmp_path)
+    assert count_handshakes(server_requests) == 2
+
+    # Expired
+    cript.API(host, "token", tls=False, session_info_dir=tmp_path, session_info_ttl=-1)
+    assert count_handshakes(server_requests) == 3
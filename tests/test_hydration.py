@@ -0,0 +1,213 @@
+import copy
+import gc
+from collections import Counter
+
+import pytest
+
+import cript
+from cript.api.exceptions import APIError
+from cript.cache import get_cached_node
+from cript.data_model.base import Base
+from cript.data_model.hydration import FIELDS_TO_SKIP, generate_nested_nodes
+from cript.data_model.nodes.base_node import BaseNode
+from cript.data_model.utils import create_node, get_data_model_class
+
+
+@pytest.fixture
+def api(host, stand_in):
+    return cript.API(host, "token", tls=False)
+
+
+def add_node(stand_in, api, slug, uid, **fields):
+    """Store a node on the stand-in server and return its URL."""
+    url = f"{api.url}/{slug}/{uid}/"
+    stand_in.nodes[uid] = dict(
+        fields, url=url, uid=uid, created_at="now", updated_at="now"
+    )
+    return url
+
+
+def add_material(stand_in, api, uid, project, **fields):
+    fields.setdefault("components", [])
+    return add_node(stand_in, api, "material", uid, project=project, name=uid, **fields)
+
+
+@pytest.fixture
+def graph(api, stand_in):
+    """
+    Materials sharing components, with a cycle and a missing node.
+    Shared nodes are listed before the nodes that reach them at a deeper level
+    since the depth-first path expanded nodes where they were first found,
+    whereas nodes are now expanded at their shallowest level.
+    """
+    group = add_node(stand_in, api, "group", "group", name="group", users=[])
+    project = add_node(stand_in, api, "project", "project", name="p", group=group)
+    urls = {
+        uid: f"{api.url}/material/{uid}/" for uid in ("m1", "m2", "m3", "m4", "gone")
+    }
+    add_material(
+        stand_in,
+        api,
+        "m1",
+        project,
+        components=[urls["m3"], urls["m2"]],
+        identifiers=[{"key": "names", "value": ["m1"]}],
+        properties=[{"key": "density", "value": 1, "components": [urls["m4"]]}],
+    )
+    add_material(stand_in, api, "m2", project, components=[urls["m3"], urls["gone"]])
+    add_material(stand_in, api, "m3", project, components=[urls["m1"]])
+    add_material(stand_in, api, "m4", project)
+    return urls
+
+
+def recursive_get(node_class, url, api, get_level, level=0):
+    """The previous implementation, which fetched nested nodes depth-first, one at a time."""
+    node = get_cached_node(url)
+    if node is None:
+        node = create_node(node_class, api.get(url))
+        recursive_expand(node, api, get_level, level)
+    return node
+
+
+def recursive_expand(obj, api, get_level, level):
+    if level <= get_level:
+        level += 1
+    skip_nodes = level > get_level
+
+    def generate(key, value):
+        if isinstance(value, str) and api.url in value and not skip_nodes:
+            try:
+                return recursive_get(
+                    get_data_model_class(key), value, api, get_level, level
+                )
+            except APIError:
+                return value
+        if isinstance(value, dict):
+            subobject = get_data_model_class(key)(**value)
+            recursive_expand(subobject, api, get_level, level)
+            return subobject
+        return value
+
+    node_dict = obj.__dict__
+    for key, value in node_dict.items():
+        if not value or key in FIELDS_TO_SKIP:
+            continue
+        if isinstance(value, list):
+            node_dict[key] = [generate(key, item) for item in value]
+        else:
+            node_dict[key] = generate(key, value)
+
+
+def describe(obj, seen):
+    """Describe an object graph, with each node expanded where it's first found."""
+    if isinstance(obj, BaseNode):
+        if obj.url in seen:
+            return ("node", obj.url)
+        seen.add(obj.url)
+    if isinstance(obj, Base):
+        return {
+            key: describe(value, seen)
+            for key, value in vars(obj).items()
+            if "__" not in key
+        }
+    if isinstance(obj, list):
+        return [describe(item, seen) for item in obj]
+    return obj
+
+
+def released(url):
+    gc.collect()
+    return get_cached_node(url) is None
+
+
+@pytest.mark.parametrize("get_level", [0, 1, 2])
+def test_same_graph_as_recursive_hydration(api, graph, get_level):
+    node = recursive_get(cript.Material, graph["m1"], api, get_level)
+    expected = describe(node, set())
+    del node
+    assert released(graph["m1"])
+
+    node = cript.Material.get(url=graph["m1"], get_level=get_level)
+    assert describe(node, set()) == expected
+
+    if get_level == 0:
+        assert node.components == [graph["m3"], graph["m2"]]
+    else:
+        assert [m.name for m in node.components] == ["m3", "m2"]
+    if get_level == 2:
+        assert node.properties[0].components[0].name == "m4"
+    del node
+    assert released(graph["m1"])
+
+
+def test_urls_fetched_once(api, graph, stand_in):
+    stand_in.requests.clear()
+    node = cript.Material.get(url=graph["m1"], get_level=5)
+
+    fetches = Counter(path for method, path, *_ in stand_in.requests)
+    assert all(count == 1 for count in fetches.values()), fetches
+    assert len(fetches) == 7
+
+    # Cycles and shared nodes are resolved to the same objects
+    m3, m2 = node.components
+    assert m2.components[0] is m3
+    assert m3.components[0] is node
+    assert m2.components[1] == graph["gone"]
+
+
+@pytest.mark.parametrize("max_workers", [2, 4])
+def test_concurrent_fetches(host, stand_in, max_workers):
+    api = cript.API(host, "token", tls=False, max_workers=max_workers)
+    group = add_node(stand_in, api, "group", "group", name="group", users=[])
+    project = add_node(stand_in, api, "project", "project", name="p", group=group)
+    components = [
+        add_material(stand_in, api, f"delay-{i}", project, group=group)
+        for i in range(4)
+    ]
+    url = add_material(stand_in, api, "root", project, components=components)
+
+    node = cript.Material.get(url=url)
+    assert [m.name for m in node.components] == [f"delay-{i}" for i in range(4)]
+    assert stand_in.max_active == max_workers
+
+
+def append_to_lists(obj, seen):
+    """Append an item to every list of an object graph."""
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+    if isinstance(obj, Base):
+        for value in vars(obj).values():
+            append_to_lists(value, seen)
+    elif isinstance(obj, list):
+        for item in obj:
+            append_to_lists(item, seen)
+        obj.append("appended")
+
+
+def test_json_left_untouched(api, graph):
+    obj_json = api.get(graph["m1"])
+    obj_json["identifiers"].append({"key": "names", "value": []})
+    obj_json["properties"][0]["conditions"] = []
+    expected = copy.deepcopy(obj_json)
+
+    node = create_node(cript.Material, obj_json)
+    generate_nested_nodes([(node, 0)], get_level=1)
+    assert obj_json == expected
+
+    # Lists of the nodes are not shared with the JSON, even empty ones
+    append_to_lists(node, set())
+    assert obj_json == expected
+
+
+def test_page_json_left_untouched(api, graph, stand_in):
+    stand_in.nodes["m1"]["identifiers"].append({"key": "names", "value": []})
+    assert released(graph["m1"])
+    paginator = cript.Material.search(project=stand_in.nodes["m1"]["project"])
+    results = paginator.json()
+    expected = copy.deepcopy(results)
+
+    nodes = list(paginator)
+    assert paginator.json() == expected
+    append_to_lists(nodes, set())
+    assert paginator.json() == expected
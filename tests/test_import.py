@@ -0,0 +1,62 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import cript
+
+# Slow modules that are only needed by some features
+LAZY_MODULES = ["pint", "globus_sdk", "distutils", "asyncio"]
+
+SCRIPT = f"""
+import json, sys
+import cript
+print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))
+"""
+
+
+def test_slow_modules_are_not_imported():
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT], capture_output=True, check=True, text=True
+    ).stdout
+    assert json.loads(output) == []
+
+
+# Max duration of `import cript` in seconds (about 0.2 s on a laptop)
+IMPORT_TIME_BUDGET = 0.6
+
+TIMING_SCRIPT = """
+import time
+start = time.perf_counter()
+import cript
+print(time.perf_counter() - start)
+"""
+
+
+@pytest.mark.benchmark
+def test_import_time():
+    durations = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMING_SCRIPT],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(3)
+    ]
+    assert min(durations) < IMPORT_TIME_BUDGET
+
+
+def test_lazy_attributes():
+    assert cript.__version__.startswith(cript.__short_version__)
+    assert str(cript.pint_ureg("1 g").to("kg")) == "0.001 kilogram"
+    assert cript.pint_ureg is cript.pint_ureg
+    assert cript.AsyncAPI.__name__ == "AsyncAPI"
+
+    from cript.storage_clients import AmazonS3Client, GlobusClient
+
+    assert AmazonS3Client.__module__ == "cript.storage_clients.s3"
+    assert GlobusClient.__module__ == "cript.storage_clients.globus"
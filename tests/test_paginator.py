@@ -0,0 +1,164 @@
+import gc
+import json
+
+import pytest
+from beartype.roar import BeartypeCallHintParamViolation
+
+import cript
+from cript.api.exceptions import APIError
+from cript.data_model import paginator as paginator_module
+from cript.data_model.paginator import Paginator, _get_offset
+
+
+@pytest.fixture
+def api(host, stand_in):
+    return cript.API(host, "token", tls=False)
+
+
+def add_materials(stand_in, api, count, project="project"):
+    """Store materials on the stand-in server and return their names in order."""
+    project_url = f"{api.url}/project/{project}/"
+    names = [f"{project}-{i}" for i in range(count)]
+    for name in names:
+        stand_in.nodes[name] = {
+            "url": f"{api.url}/material/{name}/",
+            "uid": name,
+            "created_at": "now",
+            "updated_at": "now",
+            "project": project_url,
+            "group": f"{api.url}/group/group/",
+            "name": name,
+        }
+    return project_url, names
+
+
+@pytest.fixture
+def prefetchers(monkeypatch):
+    """The background page fetchers started during a test."""
+    prefetchers = []
+
+    class RecordedPrefetcher(paginator_module._PagePrefetcher):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            prefetchers.append(self)
+
+    monkeypatch.setattr(paginator_module, "_PagePrefetcher", RecordedPrefetcher)
+    return prefetchers
+
+
+def count_pages(stand_in):
+    return sum(method == "POST" for method, *_ in stand_in.requests)
+
+
+# Numbers of results and of pages of 2 results
+@pytest.mark.parametrize("count, pages", [(0, 1), (1, 1), (4, 2), (5, 3)])
+def test_iteration_across_pages(api, stand_in, count, pages):
+    project, names = add_materials(stand_in, api, count)
+    # Not part of the results
+    add_materials(stand_in, api, 3, project="other")
+
+    paginator = cript.Material.search(project=project, get_level=0)
+    assert [obj["name"] for obj in paginator.iter_json()] == names
+    assert [material.name for material in paginator.iter_objects()] == names
+    assert [material.name for material in paginator] == names
+
+    # Each pass fetches the following pages, while the paginator stays on the first
+    assert count_pages(stand_in) == pages * 3 - 2
+    assert [obj["name"] for obj in paginator.json()] == names[:2]
+    assert paginator.count() == count
+
+
+def test_iteration_from_current_page(api, stand_in):
+    project, names = add_materials(stand_in, api, 5)
+    paginator = cript.Material.search(project=project, get_level=0)
+    paginator.next_page()
+    assert [material.name for material in paginator] == names[2:]
+
+
+def test_prefetched_iteration(api, stand_in, prefetchers):
+    project, names = add_materials(stand_in, api, 5)
+    paginator = cript.Material.search(project=project, get_level=0)
+    paginator.prefetch = 2
+    assert [material.name for material in paginator] == names
+    assert count_pages(stand_in) == 3
+    assert not prefetchers[0]._thread.is_alive()
+
+
+def test_prefetcher_stops_on_break(api, stand_in, prefetchers):
+    project, names = add_materials(stand_in, api, 20)
+    paginator = cript.Material.search(project=project, get_level=0)
+    paginator.prefetch = 1
+    for material in paginator:
+        break
+
+    # The thread has ended, at most a couple of pages ahead
+    (prefetcher,) = prefetchers
+    assert prefetcher._stop.is_set()
+    assert not prefetcher._thread.is_alive()
+    assert count_pages(stand_in) <= 4
+
+
+def test_prefetcher_stops_on_del(api, stand_in, prefetchers):
+    project, names = add_materials(stand_in, api, 20)
+    paginator = cript.Material.search(project=project, get_level=0)
+    paginator.prefetch = 1
+    paginator.next_page()
+    (prefetcher,) = prefetchers
+    assert prefetcher._thread.is_alive()
+
+    # The page being fetched may keep the paginator alive until it's done
+    del paginator
+    gc.collect()
+    prefetcher._thread.join(timeout=5)
+    assert not prefetcher._thread.is_alive()
+    assert prefetcher._stop.is_set()
+
+
+@pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+def test_del_after_invalid_arguments():
+    with pytest.raises(BeartypeCallHintParamViolation):
+        Paginator(url=1, node_name="Material")
+    gc.collect()
+
+
+def test_prefetcher_stops_on_error(api, stand_in, prefetchers):
+    project, names = add_materials(stand_in, api, 5)
+    paginator = cript.Material.search(project=project, get_level=0)
+    paginator.prefetch = 2
+    paginator.json()
+    stand_in.failures.append(500)
+
+    with pytest.raises(APIError):
+        list(paginator)
+    (prefetcher,) = prefetchers
+    assert not prefetcher._thread.is_alive()
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_fetch_all(api, stand_in, workers):
+    # Five pages, the last one partial
+    project, names = add_materials(stand_in, api, 9)
+    paginator = Paginator(
+        url=f"{api.search_url}/material/?delay=1",
+        node_name="Material",
+        payload=json.dumps({"project": project}),
+        get_level=0,
+    )
+    stand_in.requests.clear()
+    assert [obj["name"] for obj in paginator.fetch_all(workers=workers)] == names
+
+    # Each page is fetched once, at most `workers` pages at a time
+    offsets = [_get_offset(path) for _, path, *_ in stand_in.requests]
+    assert sorted(offsets) == [0, 2, 4, 6, 8]
+    assert stand_in.max_active == workers
+
+
+def test_fetch_all_from_offset(api, stand_in):
+    project, names = add_materials(stand_in, api, 7)
+    paginator = cript.Material.search(project=project, offset=4, get_level=0)
+    assert [obj["name"] for obj in paginator.fetch_all()] == names[4:]
+    materials = paginator.fetch_all(objects=True)
+    assert [material.name for material in materials] == names[4:]
+
+    with pytest.raises(ValueError):
+        paginator.fetch_all(workers=0)
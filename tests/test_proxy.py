@@ -0,0 +1,125 @@
+import pytest
+
+import cript
+from cript.data_model.proxy import NodeProxy
+
+
+@pytest.fixture
+def api(host, stand_in):
+    return cript.API(host, "token", tls=False)
+
+
+@pytest.fixture
+def urls(api, stand_in):
+    """A material whose component and project are only fetched on first access."""
+    urls = {uid: f"{api.url}/material/{uid}/" for uid in ("water", "salt")}
+    urls["project"] = f"{api.url}/project/project/"
+    urls["group"] = f"{api.url}/group/group/"
+    for uid, components in (("water", [urls["salt"]]), ("salt", [])):
+        stand_in.nodes[uid] = {
+            "url": urls[uid],
+            "uid": uid,
+            "created_at": "now",
+            "updated_at": "now",
+            "project": urls["project"],
+            "name": uid,
+            "components": components,
+        }
+    stand_in.nodes["project"] = {
+        "url": urls["project"],
+        "uid": "project",
+        "created_at": "now",
+        "updated_at": "now",
+        "name": "project",
+    }
+    return urls
+
+
+def count_gets(stand_in):
+    return sum(method == "GET" for method, *_ in stand_in.requests)
+
+
+def get_proxy(stand_in, urls):
+    material = cript.Material.get(url=urls["water"], lazy=True)
+    proxy = material.components[0]
+    assert type(proxy) is NodeProxy
+    stand_in.requests.clear()
+    return material, proxy
+
+
+def test_deferred_fetch(stand_in, urls):
+    material, proxy = get_proxy(stand_in, urls)
+    assert not proxy.is_resolved
+    assert (proxy.url, proxy.uid, proxy.node_name) == (urls["salt"], "salt", "Material")
+    assert repr(proxy) == str(proxy) == f"<NodeProxy url={urls['salt']}>"
+    assert count_gets(stand_in) == 0
+
+    # Private and special names don't fetch the node
+    assert not hasattr(proxy, "_is_modified")
+    assert not hasattr(proxy, "__fspath__")
+    with pytest.raises(AttributeError, match="_to_json"):
+        proxy._to_json()
+    assert count_gets(stand_in) == 0
+
+    # Fetched once, on first attribute access
+    assert proxy.name == "salt"
+    assert proxy.components == []
+    assert proxy.is_resolved
+    assert count_gets(stand_in) == 1
+    assert '"name": "salt"' in repr(proxy)
+
+    # Nested nodes of the fetched node are proxies too
+    assert type(proxy.project) is NodeProxy
+    assert count_gets(stand_in) == 1
+
+
+def test_isinstance_and_type_checks(stand_in, urls):
+    material, proxy = get_proxy(stand_in, urls)
+    assert isinstance(proxy, cript.Material)
+    assert isinstance(material.project, cript.Project)
+
+    # Accepted by type-checked constructors and sent as URLs
+    mixture = cript.Material(
+        project=material.project,
+        name="brine",
+        components=[material, proxy],
+        group=urls["group"],
+    )
+    assert mixture._to_dict()["components"] == [urls["water"], urls["salt"]]
+    assert mixture._to_dict()["project"] == urls["project"]
+    assert proxy._prep_for_upload() == urls["salt"]
+    assert count_gets(stand_in) == 0
+
+
+def test_equality(stand_in, urls):
+    material, proxy = get_proxy(stand_in, urls)
+
+    # Comparisons never fetch the node
+    assert proxy == NodeProxy(urls["salt"], cript.Material)
+    assert proxy != material and material != proxy
+    assert proxy != urls["salt"] and proxy is not None
+    assert count_gets(stand_in) == 0
+
+    # Equal to the node it stands for, either way around
+    salt = proxy.resolve()
+    other_proxy = NodeProxy(urls["salt"], cript.Material)
+    assert proxy == salt and salt == proxy
+    assert other_proxy == salt and salt == other_proxy
+    assert not other_proxy.is_resolved
+    assert salt in {proxy} and proxy in {salt}
+    assert {proxy: 1}[salt] == 1 and {salt: 1}[other_proxy] == 1
+    assert count_gets(stand_in) == 1
+
+
+def test_dirty_tracking_does_not_fetch(stand_in, urls):
+    material, proxy = get_proxy(stand_in, urls)
+    assert material.dirty_fields == set()
+
+    material.notes = "salty"
+    material.save(hydrate=False)
+    assert stand_in.nodes["water"]["notes"] == "salty"
+    assert material.dirty_fields == set()
+
+    material.refresh(lazy=True)
+    assert count_gets(stand_in) == 1
+    assert not proxy.is_resolved
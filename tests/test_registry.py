@@ -0,0 +1,74 @@
+import inspect
+
+import pytest
+
+import cript
+from cript.data_model.utils import _build_class_registry, get_data_model_class
+
+
+def scan_data_model_classes(key):
+    """The previous implementation, which scanned every class."""
+    for cls in cript.DATA_MODEL_CLASSES:
+        if cls.node_name.lower() == key.replace("_", "").lower():
+            return cls
+        for alt_name in getattr(cls, "alt_names", []):
+            if alt_name == key:
+                return cls
+    return None
+
+
+def get_keys():
+    """Node names, alternative names and field names, e.g., of API responses."""
+    keys = {"", "_", "unknown", "MATERIAL", "_project", "Software_Configuration"}
+    for cls in cript.DATA_MODEL_CLASSES:
+        keys.update([cls.__name__, cls.node_name, cls.node_name.lower()])
+        keys.update(getattr(cls, "alt_names", []))
+        keys.update(inspect.signature(cls).parameters)
+    return keys
+
+
+def test_lookup_matches_scan():
+    for key in get_keys():
+        assert get_data_model_class(key) is scan_data_model_classes(key), key
+
+
+def test_ambiguous_names():
+    class First:
+        node_name = "First"
+        alt_names = ["items"]
+
+    class Second:
+        node_name = "Second"
+        alt_names = ["items"]
+
+    class Third:
+        node_name = "Third"
+        alt_names = ["first"]
+
+    class Fourth:
+        node_name = "first"
+
+    assert _build_class_registry([First])
+    with pytest.raises(ValueError, match="'items' of Second is ambiguous with First"):
+        _build_class_registry([First, Second])
+    with pytest.raises(ValueError, match="'first' of Third is ambiguous with First"):
+        _build_class_registry([First, Third])
+    with pytest.raises(ValueError, match="same node name"):
+        _build_class_registry([First, Fourth])
+
+
+class ScanFreeClasses(list):
+    """Data model classes that fail if they're iterated."""
+
+    def __iter__(self):
+        raise AssertionError("The data model classes were scanned.")
+
+
+def test_lookup_does_not_scan(monkeypatch):
+    """The registry is built once and lookups don't go through the classes."""
+    expected = {key: scan_data_model_classes(key) for key in get_keys()}
+    get_data_model_class("material")
+
+    classes = ScanFreeClasses(cript.DATA_MODEL_CLASSES)
+    monkeypatch.setattr(cript, "DATA_MODEL_CLASSES", classes)
+    assert {key: get_data_model_class(key) for key in expected} == expected
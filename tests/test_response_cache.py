@@ -0,0 +1,245 @@
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+import cript
+from cript.api.response_cache import CachedResponse, DiskResponseCache, ResponseCache
+
+
+def add_node(stand_in, api, uid, **fields):
+    """Store a node on the stand-in server and return its URL."""
+    url = f"{api.url}/material/{uid}/"
+    stand_in.nodes[uid] = dict(fields, url=url, uid=uid)
+    return url
+
+
+def is_cached(api, url):
+    return api.response_cache.get(api._cache_key(url)) is not None
+
+
+def test_conditional_get(host, stand_in):
+    api = cript.API(host, "token", tls=False, cache_size=10)
+    url = add_node(stand_in, api, "water", name="water")
+
+    stand_in.requests.clear()
+    assert api.get(url)["name"] == "water"
+    assert api.get(url)["name"] == "water"
+
+    # The second GET is revalidated and answered by a 304 without a body
+    first, second = stand_in.requests
+    assert "If-None-Match" not in first[3]
+    assert second[3]["If-None-Match"]
+    assert (api.response_cache.hits, api.response_cache.misses) == (1, 1)
+
+    # Changed nodes are fetched again
+    stand_in.nodes["water"]["name"] = "ice"
+    assert api.get(url)["name"] == "ice"
+    assert api.response_cache.misses == 2
+
+    # Each caller gets its own copy of the cached JSON
+    api.get(url)["name"] = "steam"
+    assert api.get(url)["name"] == "ice"
+
+
+def test_lru_eviction(host, stand_in):
+    api = cript.API(host, "token", tls=False, cache_size=2)
+    urls = [add_node(stand_in, api, uid) for uid in ("a", "b", "c")]
+
+    api.get(urls[0])
+    api.get(urls[1])
+    api.get(urls[0])
+    api.get(urls[2])
+
+    # The least recently used response is evicted
+    assert len(api.response_cache) == 2
+    assert is_cached(api, urls[0])
+    assert not is_cached(api, urls[1])
+    assert is_cached(api, urls[2])
+
+
+@pytest.mark.parametrize("method", ["put", "patch", "delete"])
+def test_writes_invalidate(host, stand_in, method):
+    api = cript.API(host, "token", tls=False, cache_size=10)
+    url = add_node(stand_in, api, "water", name="water")
+    other_url = add_node(stand_in, api, "ice", name="ice")
+    api.get(url)
+    api.get(other_url)
+
+    if method == "delete":
+        api.delete(url)
+    else:
+        getattr(api, method)(url, data=json.dumps({"name": "steam"}))
+
+    assert not is_cached(api, url)
+    assert is_cached(api, other_url)
+    if method != "delete":
+        assert api.get(url)["name"] == "steam"
+
+
+def test_get_during_write_is_not_cached(host, stand_in, monkeypatch):
+    api = cript.API(host, "token", tls=False, cache_size=10)
+    url = add_node(stand_in, api, "water", name="water")
+    fetched = threading.Event()
+    written = threading.Event()
+    request = api._request
+
+    def slow_get(method, url, **kwargs):
+        response = request(method, url, **kwargs)
+        if method == "GET":
+            fetched.set()
+            written.wait(timeout=5)
+        return response
+
+    monkeypatch.setattr(api, "_request", slow_get)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        reading = executor.submit(api.get, url)
+        fetched.wait(timeout=5)
+        api.patch(url, data=json.dumps({"name": "ice"}))
+        written.set()
+        assert reading.result()["name"] == "water"
+
+    # The response sent before the write isn't stored
+    assert not is_cached(api, url)
+    assert api.get(url)["name"] == "ice"
+
+
+def test_cache_disabled(host, stand_in):
+    api = cript.API(host, "token", tls=False, cache_size=0)
+    assert api.response_cache is None
+
+    url = add_node(stand_in, api, "water", name="water")
+    stand_in.requests.clear()
+    api.get(url)
+    api.get(url)
+    assert len(stand_in.requests) == 2
+    assert all("If-None-Match" not in headers for *_, headers in stand_in.requests)
+
+    with pytest.raises(ValueError):
+        ResponseCache(max_size=0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A fake clock of the response caches, advanced by setting `clock.now`."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        "cript.api.response_cache.time", SimpleNamespace(time=lambda: clock.now)
+    )
+    return clock
+
+
+def test_disk_cache_ttl(host, stand_in, tmp_path, clock):
+    cache = DiskResponseCache(tmp_path / "cache.db", ttl=60)
+    api = cript.API(host, "token", tls=False, response_cache=cache)
+    url = add_node(stand_in, api, "water", name="water")
+
+    stand_in.requests.clear()
+    api.get(url)
+    api.get(url)
+    assert len(stand_in.requests) == 1
+
+    # Expired responses are revalidated
+    clock.now += 61
+    assert api.get(url)["name"] == "water"
+    assert stand_in.requests[-1][3]["If-None-Match"]
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # Expired responses that can't be revalidated are dropped
+    cache.set("key", CachedResponse(b"{}"))
+    assert cache.get("key").content == b"{}"
+    clock.now += 61
+    assert cache.get("key") is None
+    cache.evict()
+    assert cache._connect().execute("SELECT key FROM responses").fetchall() == [
+        (api._cache_key(url),)
+    ]
+
+
+def test_disk_cache_eviction(tmp_path, clock):
+    cache = DiskResponseCache(tmp_path / "cache.db", max_size=10)
+    cache.evict_interval = 3
+
+    def write(*keys):
+        for key in keys:
+            clock.now += 1
+            cache.set(key, CachedResponse(b"1234", etag='"etag"'))
+
+    # Evicted every third write, from the oldest entry on
+    write("a", "b", "c")
+    assert [cache.get(key) is not None for key in "abc"] == [False, True, True]
+    write("d", "e")
+    assert all(cache.get(key) is not None for key in "bcde")
+    write("f")
+    assert [cache.get(key) is not None for key in "bcdef"] == [False] * 3 + [True] * 2
+
+
+def test_disk_cache_shared(host, stand_in, tmp_path):
+    path = tmp_path / "cache.db"
+    api = cript.API(host, "token", tls=False, response_cache=DiskResponseCache(path))
+    other_api = cript.API(
+        host, "token", tls=False, response_cache=DiskResponseCache(path)
+    )
+    url = add_node(stand_in, api, "water", name="water")
+
+    stand_in.requests.clear()
+    api.get(url)
+    assert other_api.get(url)["name"] == "water"
+
+    # The entry stored by one session is revalidated by the other
+    first, second = stand_in.requests
+    assert "If-None-Match" not in first[3]
+    assert second[3]["If-None-Match"]
+
+    # Writes of either session invalidate the shared entry
+    other_api.patch(url, data=json.dumps({"name": "ice"}))
+    assert api.get(url)["name"] == "ice"
+
+    # Changes made elsewhere are seen at once
+    stand_in.nodes["water"]["name"] = "steam"
+    assert other_api.get(url)["name"] == "steam"
+
+
+def test_disk_cache_permissions(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = DiskResponseCache(path)
+    cache.set("key", CachedResponse(b"{}", etag='"etag"'))
+
+    # Including the WAL and shared memory files
+    paths = [path, tmp_path / "cache.db-wal", tmp_path / "cache.db-shm"]
+    assert [os.stat(p).st_mode & 0o777 for p in paths] == [0o600] * 3
+    cache.close()
+
+
+def test_disk_cache_close(tmp_path):
+    cache = DiskResponseCache(tmp_path / "cache.db")
+    done = threading.Event()
+    connected = threading.Barrier(4)
+
+    def use_cache():
+        cache.set("key", CachedResponse(b"{}", etag='"etag"'))
+        connected.wait()
+        done.wait()
+
+    threads = [threading.Thread(target=use_cache) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    connected.wait()
+    connections = list(cache._connections)
+    assert len(connections) == 4
+
+    cache.close()
+    done.set()
+    for thread in threads:
+        thread.join()
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    # The cache reconnects when used again
+    assert cache.get("key").content == b"{}"
+    cache.close()
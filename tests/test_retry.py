@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+import cript
+from cript.api.exceptions import APIError
+
+
+@pytest.fixture
+def api(host):
+    return cript.API(
+        host, "token", tls=False, retry_policy=cript.RetryPolicy(backoff_factor=0)
+    )
+
+
+def test_retry_idempotent_requests(api, server_requests, server_failures):
+    server_failures.extend([503, 429])
+    with pytest.raises(APIError, match="not found"):
+        api.get(f"{api.url}/material/missing/")
+
+    assert len(server_requests) == 3
+    assert api.retry_policy.retries == {503: 1, 429: 1}
+    assert api.retry_policy.retry_count == 2
+
+
+def test_retry_gives_up(api, server_requests, server_failures):
+    server_failures.extend([502] * 10)
+    with pytest.raises(APIError):
+        api.get(f"{api.url}/material/missing/")
+    assert len(server_requests) == api.retry_policy.total + 1
+
+
+def test_no_retry_of_non_idempotent_requests(api, server_requests, server_failures):
+    server_failures.append(503)
+    with pytest.raises(APIError):
+        api.post(f"{api.url}/material/", data="{}")
+    assert len(server_requests) == 1
+
+
+def test_retry_timeouts(host, server_requests):
+    policy = cript.RetryPolicy(total=2, backoff_factor=0)
+    api = cript.API(host, "token", tls=False, retry_policy=policy, timeout=0.05)
+
+    with pytest.raises(requests.Timeout):
+        api.get(f"{api.url}/material/delay/")
+    assert policy.retries == {"ReadTimeout": 2}
+
+
+def test_backoff():
+    policy = cript.RetryPolicy(backoff_factor=1, max_backoff=10)
+    for attempt in range(6):
+        assert 0 <= policy.get_backoff(attempt) <= min(2**attempt, 10)
+
+    assert policy.get_backoff(0, retry_after="7") == 7
+    assert policy.get_backoff(0, retry_after="3600") == 10
+    date = datetime.now(timezone.utc) + timedelta(seconds=5)
+    assert 3 < policy.get_backoff(0, retry_after=format_datetime(date)) <= 5
+    assert 0 <= policy.get_backoff(0, retry_after="invalid") <= 1
@@ -0,0 +1,95 @@
+import copy
+import importlib.util
+import json
+import pathlib
+import timeit
+
+import pytest
+
+import cript
+
+HOST = "https://criptapp.org/api"
+EXAMPLES = pathlib.Path(__file__).parents[1] / "examples"
+
+
+@pytest.fixture(scope="module")
+def materials():
+    spec = importlib.util.spec_from_file_location(
+        "create_materials", EXAMPLES / "create_materials.py"
+    )
+    create_materials = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(create_materials)
+
+    group = cript.Group(name="example_group")
+    group.url = f"{HOST}/group/00000000-0000-4000-8000-000000000000/"
+    project = cript.Project(group=group, name="testing_project")
+    project.url = f"{HOST}/project/00000000-0000-4000-8000-000000000000/"
+
+    materials = create_materials.define_materials(project)
+    for i, material in enumerate(materials):
+        material.url = f"{HOST}/material/{i:08d}-0000-4000-8000-000000000000/"
+    return materials
+
+
+def deepcopy_to_json(node):
+    """Serializer that copies the node graph before converting it."""
+    node_dict = copy.deepcopy(node._clean_dict())
+    for key, value in node_dict.items():
+        if hasattr(value, "_prep_for_upload"):
+            node_dict[key] = value._prep_for_upload()
+        elif isinstance(value, list):
+            for i in range(len(value)):
+                if hasattr(value[i], "_prep_for_upload"):
+                    value[i] = value[i]._prep_for_upload()
+    return json.dumps(node_dict, indent=4)
+
+
+def test_to_json_is_compact(materials):
+    for material in materials:
+        compact = material._to_json()
+        assert "\n" not in compact
+        assert json.loads(compact) == json.loads(repr(material))
+        assert json.loads(compact) == json.loads(deepcopy_to_json(material))
+
+
+def test_to_json_does_not_modify_node(materials):
+    material = materials[0]
+    properties = material.properties
+    material._to_json()
+    assert material.properties is properties
+    assert all(isinstance(prop, cript.Property) for prop in properties)
+    assert all(
+        isinstance(cond, cript.Condition)
+        for prop in properties
+        for cond in prop.conditions
+    )
+
+
+def test_to_json_does_not_copy(materials, monkeypatch):
+    """Nodes are serialized in one pass, without copying the node graph first."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The node graph was copied.")
+
+    expected = [json.loads(deepcopy_to_json(material)) for material in materials]
+    monkeypatch.setattr(copy, "copy", fail)
+    monkeypatch.setattr(copy, "deepcopy", fail)
+    assert [json.loads(material._to_json()) for material in materials] == expected
+
+
+@pytest.mark.benchmark
+def test_to_json_benchmark(materials):
+    """Serializing should be faster than copying the node graph first."""
+
+    def serialize_time(to_json):
+        return min(
+            timeit.repeat(
+                lambda: [to_json(material) for material in materials],
+                number=20,
+                repeat=5,
+            )
+        )
+
+    compact = serialize_time(lambda material: material._to_json())
+    copied = serialize_time(deepcopy_to_json)
+    assert compact < copied
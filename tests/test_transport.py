@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import cript
+from cript.api.exceptions import APIError
+
+# e.g., a File node
+FILE = SimpleNamespace(source=__file__, checksum="checksum")
+
+
+def test_connection_pooling(host, server_requests):
+    api = cript.API(host, "token", tls=False, pool_maxsize=4)
+
+    assert api.session.get_adapter(api.url)._pool_maxsize == 4
+    assert api.storage_client.storage_session is api.storage_session
+    assert "Authorization" not in api.storage_session.headers
+
+    server_requests.clear()
+    for _ in range(3):
+        api.storage_client.single_file_upload("uid", FILE)
+
+    # The API and the file storage each reuse a single connection
+    api_ports = {port for method, path, port, _ in server_requests if "/api/" in path}
+    storage_ports = {
+        port for method, path, port, _ in server_requests if "/storage/" in path
+    }
+    assert len(server_requests) == 6
+    assert len(api_ports) == 1
+    assert len(storage_ports) == 1
+    assert all(
+        "Authorization" not in headers
+        for _, path, _, headers in server_requests
+        if "/storage/" in path
+    )
+
+
+def test_connection_pooling_without_keep_alive(host, server_requests):
+    api = cript.API(host, "token", tls=False, keep_alive=False)
+
+    server_requests.clear()
+    for _ in range(3):
+        api.storage_client.single_file_upload("uid", FILE)
+
+    assert len({port for _, _, port, _ in server_requests}) == 6
+
+
+def test_concurrent_gets_are_coalesced(host, stand_in, server_requests):
+    api = cript.API(host, "token", tls=False)
+    url = f"{api.url}/material/delay-coalesced/"
+    stand_in.nodes["delay-coalesced"] = {"url": url, "name": "solvent"}
+
+    server_requests.clear()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(api.get, [url] * 8))
+
+    assert len(server_requests) == 1
+    assert all(result == {"url": url, "name": "solvent"} for result in results)
+    assert len({id(result) for result in results}) == 8
+
+    # Requests after the first one finished aren't coalesced
+    api.get(url)
+    assert len(server_requests) == 2
+
+    # Errors are shared too
+    server_requests.clear()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(api.get, f"{api.url}/material/delay-missing/")
+            for _ in range(4)
+        ]
+    assert all(isinstance(future.exception(), APIError) for future in futures)
+    assert len(server_requests) == 1
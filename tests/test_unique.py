@@ -0,0 +1,115 @@
+import json
+from unittest import mock
+
+import pytest
+
+import cript
+from cript.api.exceptions import APIError
+from cript.cache import get_cached_unique_url, unique_key_cache
+from cript.data_model.exceptions import UniqueNodeError
+
+HOST = "https://criptapp.org/api"
+PROJECT_URL = f"{HOST}/project/00000000-0000-4000-8000-000000000000/"
+GROUP_URL = f"{HOST}/group/00000000-0000-4000-8000-000000000000/"
+OTHER_GROUP_URL = f"{HOST}/group/00000000-0000-4000-8000-000000000001/"
+MATERIAL_URL = f"{HOST}/material/00000000-0000-4000-8000-000000000001/"
+
+
+@pytest.fixture(autouse=True)
+def clear_index():
+    unique_key_cache.clear()
+    yield
+    unique_key_cache.clear()
+
+
+def new_material(name="water"):
+    return cript.Material(project=PROJECT_URL, group=GROUP_URL, name=name)
+
+
+def save(node, api):
+    with mock.patch(
+        "cript.data_model.nodes.base_node.get_cached_api_session", return_value=api
+    ), mock.patch.object(type(node), "_generate_nested_nodes"):
+        node.save(update_existing=True)
+
+
+def respond(url, data, **kwargs):
+    return dict(json.loads(data), url=url)
+
+
+def test_saved_nodes_are_indexed():
+    material = new_material()
+    material.url = MATERIAL_URL
+    material._cache_unique_key()
+    assert get_cached_unique_url(material._unique_key()) == MATERIAL_URL
+
+    material.name = "ice"
+    material._cache_unique_key()
+    assert get_cached_unique_url(new_material()._unique_key()) is None
+    assert get_cached_unique_url(new_material("ice")._unique_key()) == MATERIAL_URL
+
+
+def test_unsaved_parents_are_not_indexed():
+    project = cript.Project(name="project", group=GROUP_URL)
+    material = cript.Material(project=project, name="water", group=GROUP_URL)
+    assert material._unique_key() is None
+
+
+def test_projects_are_indexed_by_group():
+    project = cript.Project(name="project", group=GROUP_URL)
+    project.url = PROJECT_URL
+    project._cache_unique_key()
+
+    other = cript.Project(name="project", group=OTHER_GROUP_URL)
+    assert get_cached_unique_url(other._unique_key()) is None
+    assert cript.Project(name="project")._unique_key() is None
+    assert cript.Group(name="group")._unique_key() is None
+
+
+def reject_put(url, data, valid_codes=[200]):
+    """Answer a PUT like the API does for a node that can't be edited."""
+    response = {"errors": ["You do not have permission to perform this action."]}
+    if 400 not in valid_codes:
+        raise APIError(response)
+    return response
+
+
+def test_update_existing_uses_index():
+    indexed = new_material()
+    indexed.url = MATERIAL_URL
+    indexed._cache_unique_key()
+
+    api = mock.Mock(url=HOST)
+    api.put.side_effect = respond
+    material = new_material()
+    save(material, api)
+
+    api.post.assert_not_called()
+    assert api.put.call_args.args[0] == MATERIAL_URL
+    assert material.url == MATERIAL_URL
+
+
+# The indexed node was deleted or can't be edited
+@pytest.mark.parametrize("put", [APIError("Not found."), reject_put])
+def test_update_existing_falls_back_to_post(put):
+    indexed = new_material()
+    indexed.url = MATERIAL_URL
+    indexed._cache_unique_key()
+
+    api = mock.Mock(url=HOST)
+    api.put.side_effect = put
+    api.post.side_effect = lambda url, data, **kwargs: respond(f"{url}2/", data)
+    material = new_material()
+    save(material, api)
+
+    assert api.post.called
+    assert material.url == f"{HOST}/material/2/"
+    assert get_cached_unique_url(material._unique_key()) == material.url
+
+
+def test_unique_node_error_url():
+    error = UniqueNodeError(f"This material already exists: {MATERIAL_URL}.")
+    assert error.existing_url == MATERIAL_URL
+
+    error = UniqueNodeError("This material already exists.", MATERIAL_URL)
+    assert error.existing_url == MATERIAL_URL